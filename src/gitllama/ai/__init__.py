@@ -2,19 +2,21 @@
 AI interface components
 """
 
-from .client import OllamaClient
-from .query import AIQuery, MultipleChoiceResult, SingleWordResult, OpenResult, FileWriteResult
+from .client import OllamaClient, AsyncOllamaClient
+from .query import AIQuery, MultipleChoiceResult, SingleWordResult, OpenResult, FileWriteResult, MultiFileWriteResult
 from .parser import ResponseParser
 from .context_compressor import ContextCompressor
 from .congress import Congress, CongressDecision, CongressVote, Representative
 
 __all__ = [
     "OllamaClient",
+    "AsyncOllamaClient",
     "AIQuery",
     "MultipleChoiceResult",
     "SingleWordResult", 
     "OpenResult",
     "FileWriteResult",
+    "MultiFileWriteResult",
     "ResponseParser",
     "ContextCompressor",
     "Congress",
@@ -1,13 +1,35 @@
 """Ollama API client for terminal chat interface."""
 
+import asyncio
 import json
 import requests
-from typing import Dict, List, Optional, Generator, Tuple
+from typing import AsyncGenerator, Dict, List, Optional, Generator, Tuple
 import logging
+import threading
 from ..utils.metrics import context_manager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+HTTP_POOL_SIZE = 16  # Kept-alive connections to the Ollama server
+
+# Byte markers for scanning pull progress lines without a full JSON decode
+_PULL_SUCCESS = b'"status":"success"'
+_PULL_STATUS_KEY = b'"status":"'
+
+
+def _dumps_bytes(payload: Dict) -> bytes:
+    """Serialize a request payload straight to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 
 class OllamaClient:
     """Client for interacting with local Ollama API."""
@@ -19,7 +41,11 @@ class OllamaClient:
             base_url: The base URL for the Ollama API server
         """
         self.base_url = base_url.rstrip('/')
+        # One keep-alive pool shared by every caller, including worker threads
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.model_context_sizes = {
             # Common Ollama models and their approximate context sizes
             "gemma3:270m": 32000,
@@ -32,6 +58,10 @@ class OllamaClient:
             # Default fallback
             "default": 16000
         }
+        # Model metadata only changes when a model is pulled, so successful
+        # lookups are memoized until pull_model invalidates them
+        self._model_details_cache: Dict[str, Dict] = {}
+        self._models_cache: Optional[List[str]] = None
     
     def is_available(self) -> bool:
         """Check if Ollama server is running and accessible."""
@@ -43,11 +73,14 @@ class OllamaClient:
     
     def list_models(self) -> List[str]:
         """Get list of available models."""
+        if self._models_cache is not None:
+            return list(self._models_cache)
         try:
             response = self.session.get(f"{self.base_url}/api/tags")
             response.raise_for_status()
             data = response.json()
-            return [model['name'] for model in data.get('models', [])]
+            self._models_cache = [model['name'] for model in data.get('models', [])]
+            return list(self._models_cache)
         except requests.exceptions.RequestException:
             return []
     
@@ -164,34 +197,61 @@ class OllamaClient:
     
     def get_model_details(self, model: str) -> Dict:
         """Get details for a specific model."""
+        cached = self._model_details_cache.get(model)
+        if cached is not None:
+            return cached
         try:
             response = self.session.post(
                 f"{self.base_url}/api/show",
-                json={"name": model}
+                data=_dumps_bytes({"name": model}),
+                headers=JSON_HEADERS
             )
             response.raise_for_status()
-            return response.json()
+            details = response.json()
+            self._model_details_cache[model] = details
+            return details
         except requests.exceptions.RequestException:
             return {}
     
+    def invalidate_model_cache(self, model: Optional[str] = None):
+        """Forget memoized model metadata.
+        
+        Args:
+            model: Model whose details to drop; all details when None.
+                The model list is always dropped.
+        """
+        self._models_cache = None
+        if model is None:
+            self._model_details_cache.clear()
+        else:
+            self._model_details_cache.pop(model, None)
+    
     def pull_model(self, model: str) -> bool:
         """Pull a model if it's not available locally."""
         try:
             response = self.session.post(
                 f"{self.base_url}/api/pull",
-                json={"name": model},
+                data=_dumps_bytes({"name": model}),
+                headers=JSON_HEADERS,
                 stream=True
             )
             response.raise_for_status()
             
-            for line in response.iter_lines():
-                if line:
-                    data = json.loads(line)
-                    if 'status' in data:
-                        print(f"\r{data['status']}", end='', flush=True)
-                    if data.get('status') == 'success':
-                        print()  # New line after completion
-                        return True
+            for line in response.iter_lines(decode_unicode=False):
+                if not line:
+                    continue
+                if _PULL_SUCCESS in line:
+                    print("\rsuccess")  # New line after completion
+                    self.invalidate_model_cache(model)
+                    return True
+                # Only the status text is shown, so slice it out of the raw bytes
+                start = line.find(_PULL_STATUS_KEY)
+                if start != -1:
+                    start += len(_PULL_STATUS_KEY)
+                    end = line.find(b'"', start)
+                    status = line[start:end].decode('utf-8', errors='replace')
+                    print(f"\r{status}", end='', flush=True)
+            self.invalidate_model_cache(model)
             return True
         except requests.exceptions.RequestException as e:
             logger.error(f"Error pulling model: {e}")
@@ -236,20 +296,107 @@ class OllamaClient:
             payload["system"] = system
         
         try:
-            response = self.session.post(
+            # The with-block releases the connection even if the caller closes the generator early
+            with self.session.post(
                 f"{self.base_url}/api/chat",
-                json=payload,
+                data=_dumps_bytes(payload),
+                headers=JSON_HEADERS,
                 stream=True
-            )
-            response.raise_for_status()
-            
-            for line in response.iter_lines():
-                if line:
-                    data = json.loads(line)
-                    if 'message' in data and 'content' in data['message']:
-                        yield data['message']['content']
-                    if data.get('done', False):
-                        break
+            ) as response:
+                response.raise_for_status()
+                
+                for line in response.iter_lines():
+                    if line:
+                        data = json.loads(line)
+                        if 'message' in data and 'content' in data['message']:
+                            yield data['message']['content']
+                        if data.get('done', False):
+                            break
                         
         except requests.exceptions.RequestException as e:
-            yield f"Error: {e}"
\ No newline at end of file
+            yield f"Error: {e}"
+
+
+class AsyncOllamaClient:
+    """Asyncio front-end for OllamaClient.
+    
+    Blocking HTTP calls run on the default executor so several chat streams
+    (and calls like list_models) can be awaited together on one event loop.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self, base_url: str = "http://localhost:11434",
+                 client: Optional[OllamaClient] = None):
+        """Initialize the async client.
+        
+        Args:
+            base_url: The base URL for the Ollama API server
+            client: Optional existing OllamaClient to share its session
+        """
+        self.client = client or OllamaClient(base_url)
+    
+    async def is_available(self) -> bool:
+        """Check if Ollama server is running and accessible."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.client.is_available)
+    
+    async def list_models(self) -> List[str]:
+        """List available models."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.client.list_models)
+    
+    async def chat_stream(self, model: str, messages: List[Dict[str, str]],
+                          system: Optional[str] = None,
+                          context_name: str = "default") -> AsyncGenerator[str, None]:
+        """Stream chat responses from Ollama without blocking the event loop.
+        
+        Yields:
+            Response chunks as strings
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        
+        def put(item):
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                pass  # Event loop already closed; nobody is listening
+        
+        def pump():
+            stream = self.client.chat_stream(model, messages, system, context_name)
+            try:
+                for chunk in stream:
+                    if stop.is_set():
+                        break
+                    put(chunk)
+            finally:
+                stream.close()  # Closes the HTTP response
+                put(self._DONE)
+        
+        producer = loop.run_in_executor(None, pump)
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is self._DONE:
+                    break
+                yield chunk
+        finally:
+            # Runs on break, aclose() and cancellation so the pump thread stops reading
+            stop.set()
+        await producer
+    
+    async def chat(self, model: str, messages: List[Dict[str, str]],
+                   system: Optional[str] = None, context_name: str = "default") -> str:
+        """Collect a full chat response."""
+        parts = [chunk async for chunk in self.chat_stream(model, messages, system, context_name)]
+        return ''.join(parts)
+    
+    async def chat_many(self, model: str, conversations: List[List[Dict[str, str]]],
+                        system: Optional[str] = None) -> List[str]:
+        """Run several chats concurrently and return responses in input order."""
+        return list(await asyncio.gather(*(
+            self.chat(model, messages, system, context_name=f"batch_{i}")
+            for i, messages in enumerate(conversations)
+        )))
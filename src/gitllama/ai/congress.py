@@ -4,6 +4,7 @@ A system of three Representatives with distinct personalities to evaluate AI res
 """
 
 import logging
+import threading
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 from .client import OllamaClient
@@ -42,6 +43,10 @@ class Congress:
         # Store all congressional messages and voting decisions
         self.voting_sessions = []  # Full history of all voting sessions
         self.todo_content = ""     # Store TODO.md content for alignment evaluation
+        # Analysis chunks and edit batches share one Congress across worker
+        # threads; session numbers and the history are guarded by this lock
+        self._session_lock = threading.Lock()
+        self._sessions_started = 0
         
         models_used = [rep.model for rep in REPRESENTATIVES]
         logger.info(f"🏛️ Congress initialized with individual representative models: {models_used}")
@@ -73,13 +78,14 @@ class Congress:
         """
         votes = []
         
-        # Get the current session number
-        session_num = len(self.voting_sessions) + 1
+        # Reserve the session number before voting so concurrent sessions never share one
+        with self._session_lock:
+            self._sessions_started += 1
+            session_num = self._sessions_started
+            # Build comprehensive historical context for each representative
+            historical_context = self._build_historical_context()
         logger.info(f"🏛️ Congress Session #{session_num}: Independently evaluating current {decision_type} action")
         
-        # Build comprehensive historical context for each representative
-        historical_context = self._build_historical_context()
-        
         for representative in REPRESENTATIVES:
             vote = self._get_representative_current_action_vote(
                 representative,
@@ -132,7 +138,9 @@ class Congress:
                 } for vote in votes
             ]
         }
-        self.voting_sessions.append(session_record)
+        with self._session_lock:
+            self.voting_sessions.append(session_record)
+            total_sessions = len(self.voting_sessions)
         
         # Track in context tracker with enhanced information
         context_tracker.store_variable(
@@ -142,7 +150,7 @@ class Congress:
                 "votes": f"{yes_votes}-{no_votes}",
                 "unanimity": unanimity,
                 "session_number": session_num,
-                "total_sessions": len(self.voting_sessions),
+                "total_sessions": total_sessions,
                 "vote_details": [
                     {
                         "name": vote.representative.name_title,
@@ -267,13 +275,11 @@ Vote according to your nature and whether this specific action is sound and appr
         # Get the representative's evaluation using their individual model
         messages = [{"role": "user", "content": eval_prompt}]
         
-        response = ""
-        for chunk in self.client.chat_stream(
+        response = ''.join(self.client.chat_stream(
             representative.model, 
             messages, 
             context_name=f"congress_session_{session_num}_{representative.name_title.lower().replace(' ', '_')}"
-        ):
-            response += chunk
+        ))
         
         # Parse the vote
         vote, confidence, reasoning = self._parse_vote_response(response)
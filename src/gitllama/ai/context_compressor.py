@@ -180,13 +180,11 @@ COMPRESSED CONTEXT:"""
             # Use chat_stream to get compression
             messages = [{"role": "user", "content": compression_prompt}]
             
-            response = ""
-            for chunk_response in self.client.chat_stream(
+            response = ''.join(self.client.chat_stream(
                 self.model, 
                 messages, 
                 context_name=f"compress_{chunk_label}"
-            ):
-                response += chunk_response
+            ))
             
             # Trim response if needed
             max_chunk_tokens = self.usable_context_size // 3  # Each compressed chunk should be at most 1/3
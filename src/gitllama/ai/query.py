@@ -7,7 +7,7 @@ import logging
 import re
 import time
 from typing import List, Optional, Dict, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .client import OllamaClient
 from ..utils.metrics import context_manager
 from ..utils.context_tracker import context_tracker
@@ -17,6 +17,9 @@ from .congress import Congress, CongressDecision
 
 logger = logging.getLogger(__name__)
 
+# One framed file in a multi_file_write response
+FILE_BLOCK_RE = re.compile(r"<<<FILE:\s*(.+?)\s*>>>\n(.*?)\n?<<<END>>>", re.DOTALL)
+
 
 @dataclass
 class MultipleChoiceResult:
@@ -62,6 +65,16 @@ class FileWriteResult:
     congress_decision: Optional[CongressDecision] = None
 
 
+@dataclass
+class MultiFileWriteResult:
+    """Result from a query that writes several files in one response"""
+    files: Dict[str, str]  # Path -> content, only for files found in the response
+    raw: str
+    context_compressed: bool = False
+    compression_rounds: int = 0
+    congress_decisions: Dict[str, CongressDecision] = field(default_factory=dict)
+
+
 class AIQuery:
     """Enhanced AI query interface with 4 distinct query types"""
     
@@ -128,7 +141,26 @@ Instructions:
 - Ensure the content is complete and ready to use
 - Follow appropriate syntax and conventions for the file type
 
-File content:"""
+File content:""",
+
+        "multi_file_write": """Generate the complete content for each of the files below.
+
+Context: {context}
+
+{files}
+
+Instructions:
+- Write every file listed above, in the order given
+- Frame each file exactly like this, with nothing before, between or after the frames:
+<<<FILE:path/to/file>>>
+...raw file content...
+<<<END>>>
+- Inside each frame write ONLY the content that should be saved to that file
+- Do not include explanations, comments about the task, or markdown formatting
+- Ensure every file is complete and ready to use
+- Follow appropriate syntax and conventions for each file type
+
+Files:"""
     }
     
     def __init__(self, client: OllamaClient, model: str = "gemma3:4b"):
@@ -422,7 +454,7 @@ tell it to assume we are not sudo"""
         )
         
         # Clean the response for file content
-        content = self._clean_file_content(response)
+        content = self.clean_file_content(response)
         
         # Store congress data and prompt-response pair
         congress_data = self._build_congress_data(congress_decision)
@@ -448,6 +480,86 @@ tell it to assume we are not sudo"""
         logger.info(f"✅ File content generated: {len(content)} chars")
         return result
     
+    def multi_file_write(
+        self,
+        files: Dict[str, str],
+        context: str = "",
+        context_name: str = "multi_file_write",
+        auto_compress: bool = True
+    ) -> MultiFileWriteResult:
+        """
+        Ask AI to generate several files in one response
+        
+        Args:
+            files: Mapping of file path to that file's requirements
+            context: Context shared by all files
+            context_name: Name of context window to use/create
+            auto_compress: Compress the context if it is too large
+            
+        Returns:
+            MultiFileWriteResult; files missing from the response are left out
+        """
+        variables_used = {}
+        for path, requirements in files.items():
+            variables_used[f"{path}_requirements"] = requirements
+            context_tracker.store_variable(
+                f"{context_name}_{path}_requirements", requirements, f"File write requirements for {path}"
+            )
+        
+        # Handle context and compression
+        compressed, compression_rounds, original_context = self._handle_context_compression(
+            context, self.TEMPLATES["multi_file_write"], auto_compress, context_name, variables_used
+        )
+        
+        context_text = context if context else "No additional context provided"
+        prompt = self.TEMPLATES["multi_file_write"].format(
+            context=context_text,
+            files="\n\n".join(f"File Requirements ({path}): {requirements}"
+                               for path, requirements in files.items())
+        )
+        
+        response, execution_time = self._run_query(prompt, context_name, "file_write")
+        
+        contents = {}
+        for path, body in FILE_BLOCK_RE.findall(response):
+            if path in files and path not in contents:
+                contents[path] = self.clean_file_content(body)
+        
+        # Congress votes on each file as if it had been requested on its own
+        self.ensure_todo_content_set()
+        congress_decisions = {}
+        for path, content in contents.items():
+            congress_decisions[path] = self.congress.evaluate_response(
+                original_prompt=self.TEMPLATES["file_write"].format(
+                    context=context_text, requirements=files[path]
+                ),
+                ai_response=content,
+                context="",
+                decision_type="file_write"
+            )
+            variables_used[f"{context_name}_{path}_congress"] = self._build_congress_data(
+                congress_decisions[path]
+            )
+        
+        context_tracker.store_prompt_and_response(
+            prompt=prompt, response=response, variable_map=variables_used,
+            query_type="file_write", execution_time_seconds=execution_time
+        )
+        
+        for path, content in contents.items():
+            context_tracker.store_variable(
+                f"{context_name}_{path}_file_content", content, f"Generated content for {path}"
+            )
+        
+        logger.info(f"✅ Multi-file content generated: {len(contents)}/{len(files)} files")
+        return MultiFileWriteResult(
+            files=contents,
+            raw=response.strip(),
+            context_compressed=compressed,
+            compression_rounds=compression_rounds,
+            congress_decisions=congress_decisions
+        )
+    
     # Helper methods
     
     def _handle_context_compression(self, context, template, auto_compress, context_name, variables_used):
@@ -487,20 +599,7 @@ tell it to assume we are not sudo"""
     
     def _execute_query(self, prompt, context_name, query_type):
         """Execute the query and get congress decision"""
-        start_time = time.time()
-        
-        messages = [{"role": "user", "content": prompt}]
-        
-        logger.info(f"🎯 {query_type.title()}: {prompt[:50]}...")
-        context_manager.record_ai_call(query_type, prompt[:50])
-        
-        # Get response
-        response = ""
-        for chunk in self.client.chat_stream(self.model, messages, context_name=context_name):
-            response += chunk
-        
-        execution_time = time.time() - start_time
-        logger.info(f"⏱️ Query executed in {execution_time:.2f} seconds")
+        response, execution_time = self._run_query(prompt, context_name, query_type)
         
         # Ensure TODO content is set before congressional evaluation
         self.ensure_todo_content_set()
@@ -515,6 +614,23 @@ tell it to assume we are not sudo"""
         
         return response, congress_decision, execution_time
     
+    def _run_query(self, prompt, context_name, query_type):
+        """Execute the query without congressional evaluation"""
+        start_time = time.time()
+        
+        messages = [{"role": "user", "content": prompt}]
+        
+        logger.info(f"🎯 {query_type.title()}: {prompt[:50]}...")
+        context_manager.record_ai_call(query_type, prompt[:50])
+        
+        # Get response
+        response = ''.join(self.client.chat_stream(self.model, messages, context_name=context_name))
+        
+        execution_time = time.time() - start_time
+        logger.info(f"⏱️ Query executed in {execution_time:.2f} seconds")
+        
+        return response, execution_time
+    
     def _build_congress_data(self, congress_decision):
         """Build congress data dictionary for storage"""
         return {
@@ -581,8 +697,9 @@ tell it to assume we are not sudo"""
         logger.warning(f"Could not parse continuous string from response: {response}")
         return "unknown", 0.3
     
-    def _clean_file_content(self, response):
-        """Clean response for file content"""
+    @staticmethod
+    def clean_file_content(response: str) -> str:
+        """Strip surrounding whitespace and markdown code fences from generated file content"""
         # Remove common AI response patterns
         content = response.strip()
         
@@ -27,8 +27,10 @@ class SimplifiedCoordinator:
         self.report_generator = None
         if git_url:
             try:
-                from ..utils.reports import ReportGenerator
+                from ..utils.reports import ReportGenerator, precompile_report_template
                 self.report_generator = ReportGenerator(git_url)
+                # Compile the template now so the final report only renders
+                precompile_report_template()
                 logger.info("Report generator initialized")
             except ImportError as e:
                 logger.warning(f"Report generation dependencies not available: {e}")
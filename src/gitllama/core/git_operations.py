@@ -5,15 +5,41 @@ AI-powered git automation: clone, branch, change, commit, push.
 """
 
 import os
+import sys
 import subprocess
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import logging
 
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# HTTP transport tuning for clone throughput; values already in the environment win
+CLONE_HTTP_ENV = {
+    "GIT_HTTP_MAX_REQUESTS": "8",
+    "GIT_HTTP_LOW_SPEED_LIMIT": "1000",
+    "GIT_HTTP_LOW_SPEED_TIME": "30",
+}
+CLONE_JOBS = 8
+
+
+class _JoinedCommand:
+    """Defers ' '.join(command) until a log record is actually emitted."""
+    __slots__ = ('command',)
+    
+    def __init__(self, command: list):
+        self.command = command
+    
+    def __str__(self) -> str:
+        return ' '.join(self.command)
+
 
 class GitOperationError(Exception):
     """Custom exception for git operation errors."""
@@ -23,28 +49,47 @@ class GitOperationError(Exception):
 class GitAutomator:
     """TODO-driven git automation class."""
     
-    def __init__(self, working_dir: Optional[str] = None):
+    def __init__(self, working_dir: Optional[str] = None, use_pygit2: bool = False):
         """Initialize the GitAutomator.
         
         Args:
             working_dir: Optional working directory path
+            use_pygit2: Commit in-process through libgit2 instead of the git CLI.
+                This skips commit hooks, commit.gpgsign and the GIT_AUTHOR_* /
+                GIT_COMMITTER_* identity variables, so it is off by default.
         """
         self.working_dir = Path(working_dir) if working_dir else Path(tempfile.mkdtemp())
+        self.use_pygit2 = use_pygit2 and PYGIT2_AVAILABLE
         self.repo_path: Optional[Path] = None
-        self.original_cwd = os.getcwd()
         
     def __enter__(self):
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Cleanup temporary directories
+        # Cleanup temporary directories (git commands run with cwd=, so the
+        # process working directory is never changed and needs no restoring)
         if self.repo_path and self.repo_path.exists():
-            os.chdir(self.original_cwd)
             if str(self.working_dir).startswith(tempfile.gettempdir()):
-                shutil.rmtree(self.working_dir, ignore_errors=True)
+                self._remove_working_dir()
+    
+    def _remove_working_dir(self):
+        """Delete the working directory, using rm -rf where available.
+        
+        A cloned repo has thousands of small files under .git/objects; rm walks
+        them far faster than shutil.rmtree. Falls back to shutil on Windows or
+        when rm fails.
+        """
+        if sys.platform != "win32" and shutil.which("rm"):
+            result = subprocess.run(["rm", "-rf", "--", str(self.working_dir)],
+                                    capture_output=True, check=False)
+            if result.returncode == 0:
+                return
+            logger.debug(f"rm -rf failed for {self.working_dir}, falling back to shutil")
+        shutil.rmtree(self.working_dir, ignore_errors=True)
     
     def _run_git_command(self, command: list, cwd: Optional[Path] = None, 
-                        capture_output: bool = True, check: bool = True) -> subprocess.CompletedProcess:
+                        capture_output: bool = True, check: bool = True,
+                        env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
         """Execute a git command and return the result.
         
         Args:
@@ -52,6 +97,7 @@ class GitAutomator:
             cwd: Working directory (defaults to repo_path)
             capture_output: Whether to capture stdout/stderr
             check: Whether to raise exception on non-zero return code
+            env: Optional environment for the subprocess (defaults to inherited)
             
         Returns:
             CompletedProcess object with returncode, stdout, stderr
@@ -59,13 +105,14 @@ class GitAutomator:
         work_dir = cwd or self.repo_path or self.working_dir
         
         try:
-            logger.info(f"🔧 Git operation: {' '.join(command)}")
+            logger.info("🔧 Git operation: %s", _JoinedCommand(command))
             result = subprocess.run(
                 command,
                 cwd=work_dir,
                 capture_output=capture_output,
                 text=True,
-                check=check
+                check=check,
+                env=env
             )
             
             # For backward compatibility, if check=True and capture_output=True,
@@ -90,8 +137,16 @@ class GitAutomator:
             logger.error(error_msg)
             raise GitOperationError(error_msg) from e
     
-    def clone_repository(self, git_url: str) -> Path:
-        """Clone a git repository."""
+    def clone_repository(self, git_url: str, recurse_submodules: bool = False,
+                         sparse: bool = False) -> Path:
+        """Clone a git repository.
+        
+        Args:
+            git_url: URL of the repository to clone
+            recurse_submodules: Also clone submodules, fetching them in parallel
+            sparse: Blobless clone that only checks out root-level files, for
+                callers like make_changes that touch a single file at the root
+        """
         logger.info(f"🔧 Git: Cloning repository: {git_url}")
         
         # Extract repository name from URL
@@ -101,7 +156,22 @@ class GitAutomator:
         
         self.repo_path = self.working_dir / repo_name
         
-        self._run_git_command(['git', 'clone', git_url, str(self.repo_path)], cwd=self.working_dir)
+        command = ['git', 'clone']
+        if sparse:
+            command += ['--filter=blob:none', '--no-checkout']
+        if recurse_submodules:
+            command += ['--recurse-submodules', f'--jobs={CLONE_JOBS}']
+        command += [git_url, str(self.repo_path)]
+        
+        self._run_git_command(command, cwd=self.working_dir,
+                              env={**CLONE_HTTP_ENV, **os.environ})
+        
+        if sparse:
+            # Empty cone: only files at the repository root are materialized
+            self._run_git_command(['git', 'sparse-checkout', 'init', '--cone'])
+            self._run_git_command(['git', 'sparse-checkout', 'set'])
+            self._run_git_command(['git', 'checkout'])
+        
         logger.info(f"Successfully cloned to {self.repo_path}")
         return self.repo_path
     
@@ -112,11 +182,9 @@ class GitAutomator:
         
         # First check if the branch already exists (locally or remotely)
         try:
-            # Check if branch exists locally
-            result = self._run_git_command(['git', 'rev-parse', '--verify', branch_name], 
-                                          capture_output=True, check=False)
+            local_exists, remote_exists = self._find_branch_refs(branch_name)
             
-            if result.returncode == 0:
+            if local_exists:
                 # Branch exists locally, just checkout (no -b)
                 logger.info(f"🔧 Git: Checking out existing branch: {branch_name}")
                 self._run_git_command(['git', 'checkout', branch_name])
@@ -125,10 +193,7 @@ class GitAutomator:
             
             # Check if branch exists as remote
             remote_branch = f"origin/{branch_name}"
-            result = self._run_git_command(['git', 'rev-parse', '--verify', remote_branch],
-                                          capture_output=True, check=False)
-            
-            if result.returncode == 0:
+            if remote_exists:
                 # Remote branch exists, create tracking branch
                 logger.info(f"🔧 Git: Creating tracking branch from remote: {branch_name}")
                 self._run_git_command(['git', 'checkout', '-b', branch_name, remote_branch])
@@ -144,6 +209,22 @@ class GitAutomator:
         except subprocess.CalledProcessError as e:
             raise GitOperationError(f"Failed to checkout branch {branch_name}: {e}")
     
+    def _find_branch_refs(self, branch_name: str) -> Tuple[bool, bool]:
+        """Check local and origin refs for a branch with a single git call.
+        
+        Returns:
+            Tuple of (exists_locally, exists_on_origin)
+        """
+        local_ref = f"refs/heads/{branch_name}"
+        remote_ref = f"refs/remotes/origin/{branch_name}"
+        result = self._run_git_command(
+            ['git', 'for-each-ref', '--format=%(refname)', local_ref, remote_ref],
+            check=False
+        )
+        # for-each-ref patterns also match refs nested below them, so compare exactly
+        refs = set(result.stdout.splitlines()) if result.stdout else set()
+        return local_ref in refs, remote_ref in refs
+    
     def make_changes(self) -> list:
         """
         Fallback method to make simple changes.
@@ -175,6 +256,16 @@ class GitAutomator:
         
         logger.info("Committing changes")
         
+        # Generate commit message
+        message = "feat: automated improvements by GitLlama AI\n\n🤖 Generated with GitLlama v0.7.4\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
+        
+        # libgit2 commits are opt-in: they bypass hooks, signing and env identity
+        if self.use_pygit2:
+            try:
+                return self._commit_with_pygit2(message)
+            except (pygit2.GitError, KeyError) as e:
+                logger.warning(f"pygit2 commit failed, falling back to git CLI: {e}")
+        
         # Check if there are any changes to commit
         status_result = self._run_git_command(['git', 'status', '--porcelain'])
         if not status_result.stdout.strip():
@@ -192,9 +283,6 @@ class GitAutomator:
             logger.warning("No staged changes to commit after git add")
             return "no-changes", "No staged changes to commit"
         
-        # Generate commit message
-        message = "feat: automated improvements by GitLlama AI\n\n🤖 Generated with GitLlama v0.7.4\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
-        
         # Commit changes
         self._run_git_command(['git', 'commit', '-m', message])
         
@@ -205,6 +293,40 @@ class GitAutomator:
         
         return commit_hash, message
     
+    def _commit_with_pygit2(self, message: str) -> tuple[str, str]:
+        """Stage everything and commit via libgit2, avoiding git subprocesses.
+        
+        Unlike `git commit`, this does not run hooks, honour commit.gpgsign or
+        read GIT_AUTHOR_*/GIT_COMMITTER_* from the environment.
+        
+        Returns:
+            Tuple of (commit_hash, commit_message)
+        """
+        repo = pygit2.Repository(str(self.repo_path))
+        
+        if not repo.status():
+            logger.warning("No changes to commit")
+            return "no-changes", "No changes to commit"
+        
+        logger.info("🔧 Git: Adding all changes to staging")
+        index = repo.index
+        index.add_all()
+        index.write()
+        tree = index.write_tree()
+        
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        if parents and repo.head.peel(pygit2.Commit).tree_id == tree:
+            logger.warning("No staged changes to commit after git add")
+            return "no-changes", "No staged changes to commit"
+        
+        # Raises KeyError when user.name/user.email are not configured
+        signature = repo.default_signature
+        commit_id = repo.create_commit('HEAD', signature, signature, message, tree, parents)
+        commit_hash = str(commit_id)
+        logger.info(f"🔧 Git: Successfully committed: {commit_hash[:8]}")
+        
+        return commit_hash, message
+    
     def push_changes(self, branch: Optional[str] = None) -> str:
         """Push changes to the remote repository."""
         if not self.repo_path:
@@ -4,24 +4,60 @@ Specialized for analyzing TODO.md files and Python code generation requirements
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 from ..ai import OllamaClient, AIQuery
 from ..utils.context_tracker import context_tracker
 
 logger = logging.getLogger(__name__)
 
+READ_WORKERS = 32
+SKIP_DIRS = frozenset({'node_modules', '__pycache__'})
+# Build output is only pruned at the repository root; src/build may be a real package
+ROOT_ARTIFACT_DIRS = frozenset({'dist', 'build'})
+MAX_FILE_SIZE = 100_000  # bytes
+BINARY_SNIFF_SIZE = 4096
+PREVIEW_TOKENS = 500  # Per-file budget when building chunk context
+
+# (base_url, model) -> context size, shared by all analyzer instances
+_CONTEXT_SIZE_CACHE: Dict[Tuple[str, str], int] = {}
+
 
 class TodoAnalyzer:
     """Analyzes repository for Python application generation based on TODO.md requirements"""
     
-    def __init__(self, client: OllamaClient, model: str = "gemma3:4b"):
+    # Suffixes without the leading dot, matched against name.rpartition('.')
+    TEXT_EXTENSIONS = frozenset({'py', 'js', 'tsx', 'jsx', 'md', 'txt', 'json',
+                                 'yaml', 'yml', 'toml', 'ini', 'cfg', 'conf',
+                                 'sh', 'bash', 'java', 'c', 'cpp', 'go', 'rs'})
+    # Extensionless files worth analyzing
+    SPECIAL_FILES = frozenset({'Dockerfile', 'Makefile', 'Procfile'})
+    
+    def __init__(self, client: OllamaClient, model: str = "gemma3:4b", parallel_chunks: int = 4):
+        """Initialize the analyzer.
+        
+        Args:
+            client: Ollama client; chunk workers all share it, and with it
+                its keep-alive connection pool
+            model: Model used for analysis
+            parallel_chunks: Number of chunks analyzed concurrently
+        """
         self.client = client
         self.model = model
+        self.parallel_chunks = max(1, parallel_chunks)
         self.ai = AIQuery(client, model)
-        self.max_context_size = self.client.get_model_context_size(model)
+        self.max_context_size = self._context_size_for(model)
         self.usable_context_size = int(self.max_context_size * 0.7)
         
+    def _context_size_for(self, model: str) -> int:
+        """Model context size, looked up once per server and model per process"""
+        key = (self.client.base_url, model)
+        if key not in _CONTEXT_SIZE_CACHE:
+            _CONTEXT_SIZE_CACHE[key] = self.client.get_model_context_size(model)
+        return _CONTEXT_SIZE_CACHE[key]
+    
     def analyze_with_todo(self, repo_path: Path) -> Dict:
         """Main entry point for TODO-driven analysis with context tracking"""
         logger.info("Starting TODO-driven repository analysis")
@@ -68,21 +104,24 @@ class TodoAnalyzer:
             "Summary of file chunking for analysis"
         )
         
-        # Step 4: Ask TODO relation question for each chunk
-        chunk_responses = []
+        # Step 4: Ask TODO relation question for each chunk. Chunks are
+        # independent, so their Ollama calls run concurrently
         for i, chunk in enumerate(chunks, 1):
-            logger.info(f"Analyzing chunk {i}/{len(chunks)} against TODO")
-            
             # Track this chunk's content
             context_tracker.store_variable(
                 f"chunk_{i}_files",
                 [f['path'] for f in chunk],
                 f"Files in chunk {i}"
             )
-            
-            response = self._ask_todo_relation(todo_content, chunk, i, len(chunks))
-            chunk_responses.append(response)
-            
+        
+        def analyze_chunk(i: int, chunk: List[Dict]) -> str:
+            logger.info(f"Analyzing chunk {i}/{len(chunks)} against TODO")
+            return self._ask_todo_relation(todo_content, chunk, i, len(chunks))
+        
+        with ThreadPoolExecutor(max_workers=self.parallel_chunks) as pool:
+            chunk_responses = list(pool.map(analyze_chunk, range(1, len(chunks) + 1), chunks))
+        
+        for i, response in enumerate(chunk_responses, 1):
             # Track chunk response
             context_tracker.store_variable(
                 f"chunk_{i}_analysis",
@@ -129,39 +168,84 @@ class TodoAnalyzer:
     
     def _gather_files(self, repo_path: Path) -> List[Dict]:
         """Gather all readable files"""
-        files = []
-        text_extensions = {'.py', '.js', '.tsx', '.jsx', '.md', '.txt', '.json', 
-                          '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
-                          '.sh', '.bash', '.java', '.c', '.cpp', '.go', '.rs'}
-        
-        for file_path in repo_path.rglob("*"):
-            # Skip hidden directories
-            if any(part.startswith('.') for part in file_path.parts):
+        text_extensions = self.TEXT_EXTENSIONS
+        special_files = self.SPECIAL_FILES
+        
+        candidates = []
+        for entry in self._iter_source_files(repo_path):
+            # One membership test per file: by suffix if it has one, else by name
+            name = entry.name
+            _, dot, ext = name.rpartition('.')
+            if not (ext in text_extensions if dot else name in special_files):
+                continue
+            # DirEntry caches the stat, so oversized files cost no extra syscall
+            if entry.stat(follow_symlinks=False).st_size > MAX_FILE_SIZE:
+                logger.debug(f"Skipping large file {entry.path}")
+                continue
+            candidates.append(Path(entry.path))
+        
+        # Reads are I/O bound, so threads overlap them; map keeps walk order
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+            results = pool.map(lambda path: self._read_file(repo_path, path), candidates)
+            return [file_data for file_data in results if file_data is not None]
+    
+    def _iter_source_files(self, root: Path) -> Iterator[os.DirEntry]:
+        """Walk root with os.scandir, pruning hidden and generated directories
+        before descending into them"""
+        root_dir = str(root)
+        stack = [root_dir]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError as e:
+                logger.debug(f"Could not scan {directory}: {e}")
                 continue
             
-            if file_path.is_file() and file_path.suffix in text_extensions:
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    files.append({
-                        'path': str(file_path.relative_to(repo_path)),
-                        'content': content,
-                        'tokens': self.client.count_tokens(content)
-                    })
-                except Exception as e:
-                    logger.debug(f"Could not read {file_path}: {e}")
-        
-        return files
+            subdirs = []
+            for entry in entries:
+                # Skip hidden files and directories
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in SKIP_DIRS:
+                        continue
+                    if directory == root_dir and entry.name in ROOT_ARTIFACT_DIRS:
+                        continue
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+            # Reversed so subdirectories are visited in name order
+            stack.extend(reversed(subdirs))
+    
+    def _read_file(self, repo_path: Path, file_path: Path) -> Optional[Dict]:
+        """Read one file and estimate its tokens, skipping binary content"""
+        try:
+            with open(file_path, 'rb') as f:
+                head = f.read(BINARY_SNIFF_SIZE)
+                if b'\x00' in head:
+                    logger.debug(f"Skipping binary file {file_path}")
+                    return None
+                content = (head + f.read()).decode('utf-8', errors='ignore')
+        except Exception as e:
+            logger.debug(f"Could not read {file_path}: {e}")
+            return None
+        
+        return {
+            'path': str(file_path.relative_to(repo_path)),
+            'content': content,
+            'tokens': self.client.count_tokens(content)
+        }
     
     def _create_simple_chunks(self, files: List[Dict]) -> List[List[Dict]]:
-        """Create simple chunks that fit in context window"""
+        """Pack files into as few context-sized chunks as possible
+        (first-fit decreasing by token count)"""
         chunk_size = self.usable_context_size - 1000  # Reserve space for TODO and prompt
         chunks = []
-        current_chunk = []
-        current_tokens = 0
+        bins = []  # [remaining_tokens, files] per packed chunk
         
-        for file_data in files:
+        for file_data in sorted(files, key=lambda f: f['tokens'], reverse=True):
             file_tokens = file_data['tokens']
             
             # If file is too large, truncate it
@@ -172,19 +256,16 @@ class TodoAnalyzer:
                 chunks.append([truncated])
                 continue
             
-            # If adding would exceed, start new chunk
-            if current_tokens + file_tokens > chunk_size:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = [file_data]
-                current_tokens = file_tokens
+            # Place into the first chunk with room, else open a new one
+            for packed in bins:
+                if packed[0] >= file_tokens:
+                    packed[0] -= file_tokens
+                    packed[1].append(file_data)
+                    break
             else:
-                current_chunk.append(file_data)
-                current_tokens += file_tokens
-        
-        if current_chunk:
-            chunks.append(current_chunk)
+                bins.append([chunk_size - file_tokens, [file_data]])
         
+        chunks.extend(packed_files for _, packed_files in bins)
         return chunks
     
     def _ask_todo_relation(self, todo_content: str, chunk: List[Dict], 
@@ -194,9 +275,7 @@ class TodoAnalyzer:
         context_parts = []
         for file_data in chunk:
             context_parts.append(f"=== File: {file_data['path']} ===")
-            context_parts.append(file_data['content'][:2000])  # Limit per file
-            if len(file_data['content']) > 2000:
-                context_parts.append("... [truncated]")
+            context_parts.append(self._preview(file_data))  # Limit per file
             context_parts.append("")
         
         context = "\n".join(context_parts)
@@ -230,6 +309,21 @@ Be specific about Python files, packages, and deployment considerations."""
         
         return result.content
     
+    def _preview(self, file_data: Dict) -> str:
+        """Fit a file into the per-file token budget, keeping head and tail.
+        
+        The end of a file often holds its classes and exports, so the middle
+        is elided instead of the tail.
+        """
+        content = file_data['content']
+        if file_data['tokens'] <= PREVIEW_TOKENS:
+            return content
+        
+        budget = PREVIEW_TOKENS * 4  # Same chars-per-token ratio as count_tokens
+        head = int(budget * 0.6)
+        tail = budget - head
+        return f"{content[:head]}\n... [middle elided] ...\n{content[-tail:]}"
+    
     def _summarize_responses(self, responses: List[str], todo_content: str) -> str:
         """Summarize all chunk responses"""
         combined = "\n\n=== CHUNK RESPONSE ===\n".join(responses)
@@ -3,23 +3,122 @@ Python Application Executor for TODOllama
 Executes Python application generation with Docker containerization and comprehensive testing
 """
 
+import hashlib
 import logging
+import os
+import secrets
+import shutil
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from ..ai import OllamaClient, AIQuery
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from ..ai import OllamaClient, AIQuery, FileWriteResult, MultiFileWriteResult
 
 logger = logging.getLogger(__name__)
 
+# EDIT files generated per AI request
+FILE_WRITE_BATCH = 4
+WRITE_BUFFER_SIZE = 1 << 20
+# Bounds for remembered file_write results
+FILE_WRITE_CACHE_SIZE = 128
+FILE_WRITE_CACHE_MAX_CONTENT = 1 << 20
+# Prompt pieces for file generation; only the paths vary per call
+_PLAN_HEADER = "=== PLAN CONTEXT ==="
+_TODO_HEADER = "=== TODO CONTEXT ==="
+_CURRENT_CONTENT_HEADER = "=== CURRENT FILE CONTENT (for reference) ==="
+
+_REWRITE_REQUIREMENTS = """You are completely rewriting the Python application file: {path}
+
+TASK: Completely rewrite {path} according to the Python containerization plan provided in the context.
+
+REQUIREMENTS:
+- This is a COMPLETE rewrite of {path}
+- The file currently exists and its content is shown in the context for reference  
+- Follow the plan and TODO requirements exactly for Python application development
+- Generate production-ready Python code with proper error handling, logging, and documentation
+- Use modern Python best practices: type hints, docstrings, proper imports
+- For Python files (.py): Include proper imports, error handling, logging setup
+- For Docker files: Use official Python base images, multi-stage builds where appropriate
+- For config files: Use environment variables, proper validation
+- For requirements.txt: Pin versions for production stability
+- Do NOT include markdown code blocks or explanations
+- Output only the raw file content that will be saved to {path}"""
+
+_CREATE_REQUIREMENTS = """You are creating a new Python application file: {path}
+
+TASK: Create complete content for the new file {path} based on the Python containerization plan and TODO.
+
+REQUIREMENTS:
+- This is a NEW file creation for {path}
+- Follow the plan and TODO requirements exactly for Python application development
+- Generate production-ready Python code with proper error handling, logging, and documentation
+- Use modern Python best practices: type hints, docstrings, proper imports
+- For Python files (.py): Include proper imports, error handling, logging setup, main guards
+- For Docker files: Use official Python base images, efficient layering, health checks
+- For config files: Use environment variables, proper validation
+- For requirements.txt: Pin versions for production stability
+- For test files: Use pytest framework with proper fixtures and assertions
+- Do NOT include markdown code blocks or explanations  
+- Output only the raw file content that will be saved to {path}"""
+
+
+def _request_key(*parts: str) -> str:
+    """Hash the text of a generation request into a cache key"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _atomic_write(path: Path, data: str):
+    """Write data to a sibling temp file, then rename it over path
+    
+    Readers never see a half-written file. A symlinked path is written through
+    to its target, an existing file keeps its mode and a new file gets the
+    mode the process umask gives it.
+    """
+    target = Path(os.path.realpath(path))
+    while True:
+        tmp_path = target.with_name(f".{target.name}.{secrets.token_hex(6)}.tmp")
+        try:
+            # 0o666 lets the kernel apply the umask, as open() would
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with open(fd, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class TodoExecutor:
     """Executes Python application generation with Docker containerization and comprehensive testing"""
     
-    def __init__(self, client: OllamaClient, model: str = "gemma3:4b"):
+    def __init__(self, client: OllamaClient, model: str = "gemma3:4b", parallel_edits: int = 4):
+        """Initialize the executor.
+        
+        Args:
+            client: Ollama client
+            model: Model used for generation
+            parallel_edits: Number of file-generation requests run concurrently
+        """
         self.client = client
         self.model = model
         self.ai = AIQuery(client, model)
+        self.parallel_edits = max(1, parallel_edits)
+        # file_write results keyed on a hash of requirements + context
+        self._file_write_cache: Dict[str, Union[FileWriteResult, MultiFileWriteResult]] = {}
+        # Edit batches run on worker threads and share the cache
+        self._file_write_cache_lock = threading.Lock()
     
     def execute_plan(self, repo_path: Path, action_plan: Dict) -> tuple[List[str], Dict[str, Dict]]:
         """Execute the action plan and capture file diffs
@@ -31,30 +130,31 @@ class TodoExecutor:
         
         modified_files = []
         file_diffs = {}
+        created_dirs = set()
+        
+        # Generate EDIT content up front, several files per AI request
+        edit_targets = []
+        for file_info in action_plan['files_to_modify']:
+            file_path = repo_path / file_info['path']
+            if file_info['operation'] != 'EDIT' or (file_path.exists() and file_path.is_dir()):
+                continue
+            original_content = file_path.read_text() if file_path.is_file() else ""
+            edit_targets.append((file_info['path'], original_content))
+        generated = self._generate_edits(edit_targets, action_plan['plan'], action_plan['todo_excerpt'])
         
         for file_info in action_plan['files_to_modify']:
             file_path = repo_path / file_info['path']
             operation = file_info['operation']
             
-            logger.info(f"Executing {operation} on {file_info['path']}")
+            logger.info("Executing %s on %s", operation, file_info['path'])
             
             if operation == 'EDIT':
                 # Validate file path - skip if it's a directory
                 if file_path.exists() and file_path.is_dir():
-                    logger.warning(f"Skipping directory path: {file_info['path']} - cannot write to directory")
+                    logger.warning("Skipping directory path: %s - cannot write to directory", file_info['path'])
                     continue
                 
-                # Check if file exists to provide context to AI
-                original_content = ""
-                if file_path.exists() and file_path.is_file():
-                    original_content = file_path.read_text()
-                
-                content = self._edit_file_content(
-                    file_info['path'],
-                    original_content,
-                    action_plan['plan'],
-                    action_plan['todo_excerpt']
-                )
+                original_content, content = generated[file_info['path']]
                 
                 # Store diff information
                 file_diffs[file_info['path']] = {
@@ -64,12 +164,14 @@ class TodoExecutor:
                 }
                 
                 try:
-                    file_path.parent.mkdir(parents=True, exist_ok=True)
-                    file_path.write_text(content)
+                    if file_path.parent not in created_dirs:
+                        file_path.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(file_path.parent)
+                    _atomic_write(file_path, content)
                     modified_files.append(file_info['path'])
-                    logger.info(f"✅ Successfully wrote file: {file_info['path']}")
+                    logger.info("✅ Successfully wrote file: %s", file_info['path'])
                 except Exception as e:
-                    logger.error(f"❌ Failed to write file {file_info['path']}: {e}")
+                    logger.error("❌ Failed to write file %s: %s", file_info['path'], e)
                     continue
                 
             elif operation == 'DELETE':
@@ -83,7 +185,7 @@ class TodoExecutor:
                     file_path.unlink()
                     modified_files.append(file_info['path'])
                 else:
-                    logger.warning(f"File to delete doesn't exist: {file_info['path']}")
+                    logger.warning("File to delete doesn't exist: %s", file_info['path'])
         
         return modified_files, file_diffs
     
@@ -163,85 +265,169 @@ class TodoExecutor:
                 "error": str(e)
             }
     
-    def _edit_file_content(self, file_path: str, original_content: str, plan: str, todo: str) -> str:
-        """Edit file content (create new or completely rewrite existing)"""
-        from ..utils.context_tracker import context_tracker
+    def _generate_edits(self, targets: List[Tuple[str, str]], plan: str, todo: str) -> Dict[str, Tuple[str, str]]:
+        """Generate new content for EDIT targets, batching files into shared AI requests
         
-        # Store variables separately instead of embedding in context
-        file_name = Path(file_path).name
-        file_type = Path(file_path).suffix
-        context_name = f"rewrite_{file_name}" if original_content else f"create_{file_name}"
+        Args:
+            targets: (path, original_content) pairs
+            plan: Action plan text
+            todo: TODO excerpt
+            
+        Returns:
+            Mapping of path to (original_content, new_content)
+        """
+        batches = [targets[start:start + FILE_WRITE_BATCH]
+                   for start in range(0, len(targets), FILE_WRITE_BATCH)]
+        if not batches:
+            return {}
+        
+        def edit_batch(batch_number: int, batch: List[Tuple[str, str]]) -> List[Tuple[str, Tuple[str, str]]]:
+            contents = self._edit_files_batch(batch, plan, todo, batch_number) if len(batch) > 1 else {}
+            results = []
+            for path, original_content in batch:
+                if path not in contents:
+                    contents[path] = self._edit_file_content(path, original_content, plan, todo)
+                results.append((path, (original_content, contents[path])))
+            return results
+        
+        # Batches are independent requests, so several can generate at once
+        generated = {}
+        with ThreadPoolExecutor(max_workers=min(self.parallel_edits, len(batches))) as pool:
+            for results in pool.map(edit_batch, range(1, len(batches) + 1), batches):
+                generated.update(results)
+        return generated
+    
+    def _file_write(self, requirements: str, context: str, context_name: str) -> FileWriteResult:
+        """Run a file_write query, reusing the result of an identical earlier request"""
+        return self._cached_write(
+            _request_key("file_write", requirements, context), context_name,
+            lambda: self.ai.file_write(requirements=requirements, context=context, context_name=context_name)
+        )
+    
+    def _multi_file_write(self, files: Dict[str, str], context: str, context_name: str) -> MultiFileWriteResult:
+        """Run a multi_file_write query, reusing the result of an identical earlier request"""
+        parts = [part for path, requirements in files.items() for part in (path, requirements)]
+        return self._cached_write(
+            _request_key("multi_file_write", *parts, context), context_name,
+            lambda: self.ai.multi_file_write(files=files, context=context, context_name=context_name)
+        )
+    
+    def _cached_write(self, key: str, context_name: str,
+                      run: Callable[[], Union[FileWriteResult, MultiFileWriteResult]]):
+        """Return the remembered result for key, or run the query and remember it"""
+        with self._file_write_cache_lock:
+            cached = self._file_write_cache.get(key)
+        if cached is not None:
+            logger.info("Reusing cached file content for %s", context_name)
+            return cached
+        
+        # The query itself runs outside the lock so batches still generate in parallel
+        result = run()
+        
+        if len(result.raw) <= FILE_WRITE_CACHE_MAX_CONTENT:
+            with self._file_write_cache_lock:
+                if key not in self._file_write_cache and len(self._file_write_cache) >= FILE_WRITE_CACHE_SIZE:
+                    # Evict the oldest entry
+                    self._file_write_cache.pop(next(iter(self._file_write_cache)))
+                self._file_write_cache[key] = result
+        return result
+    
+    def _edit_files_batch(self, batch: List[Tuple[str, str]], plan: str, todo: str,
+                          batch_number: int = 1) -> Dict[str, str]:
+        """Write several files in one AI request
         
-        # Store individual variables for tracking
-        context_tracker.store_variable(f"{context_name}_file_path", file_path, f"Target file path: {file_path}")
-        context_tracker.store_variable(f"{context_name}_file_name", file_name, f"Target file name: {file_name}")  
-        context_tracker.store_variable(f"{context_name}_file_type", file_type, f"File extension: {file_type}")
-        context_tracker.store_variable(f"{context_name}_plan", plan[:1500], "Action plan excerpt")
-        context_tracker.store_variable(f"{context_name}_todo", todo[:500], "TODO excerpt")
+        Args:
+            batch: (path, original_content) pairs
+            plan: Action plan text
+            todo: TODO excerpt
+            batch_number: Position of this batch, keeping its tracked context name unique
         
-        if original_content:
-            context_tracker.store_variable(f"{context_name}_original_content", original_content[:2000], "Current file content for reference")
+        Returns:
+            Mapping of path to generated content; files missing from the
+            response are left out so the caller can retry them one at a time
+        """
+        context_name = f"batch_write_{batch_number}_{len(batch)}_files"
+        plan_excerpt = plan[:1500]
+        todo_excerpt = todo[:500]
+        
+        context_parts = [_PLAN_HEADER, plan_excerpt, "", _TODO_HEADER, todo_excerpt]
+        files = {}
+        for path, original_content in batch:
+            if original_content:
+                context_parts.extend([
+                    "",
+                    f"=== CURRENT CONTENT OF {path} (for reference) ===",
+                    original_content[:2000]
+                ])
+            # Each file gets the same per-type rules as a single-file edit
+            template = _REWRITE_REQUIREMENTS if original_content else _CREATE_REQUIREMENTS
+            files[path] = template.format(path=path)
         
-        # Build clean context without embedded variables
-        context_parts = [
-            "=== PLAN CONTEXT ===",
-            plan[:1500],
-            "",
-            "=== TODO CONTEXT ===", 
-            todo[:500]
-        ]
+        try:
+            result = self._multi_file_write(files, "\n".join(context_parts), context_name)
+        except Exception as e:
+            logger.warning("Batched file write failed, falling back to one file per request: %s", e)
+            return {}
+        
+        for path, original_content in batch:
+            if path in result.files:
+                self._store_file_variables(path, original_content, plan_excerpt, todo_excerpt)
+        
+        if len(result.files) < len(batch):
+            logger.warning("Batched file write returned %d/%d files, generating the rest one at a time",
+                           len(result.files), len(batch))
+        else:
+            logger.info("✅ Generated %d files in one request", len(batch))
+        return dict(result.files)
+    
+    def _store_file_variables(self, file_path: str, original_content: str,
+                              plan_excerpt: str, todo_excerpt: str) -> str:
+        """Track the variables behind one file's generation for the report
+        
+        Returns:
+            The per-file context name (create_<name> or rewrite_<name>)
+        """
+        from ..utils.context_tracker import context_tracker
         
+        target = Path(file_path)
+        file_name = target.name
+        file_type = target.suffix
+        context_name = f"rewrite_{file_name}" if original_content else f"create_{file_name}"
+        
+        variables = {
+            f"{context_name}_file_path": (file_path, f"Target file path: {file_path}"),
+            f"{context_name}_file_name": (file_name, f"Target file name: {file_name}"),
+            f"{context_name}_file_type": (file_type, f"File extension: {file_type}"),
+            f"{context_name}_plan": (plan_excerpt, "Action plan excerpt"),
+            f"{context_name}_todo": (todo_excerpt, "TODO excerpt"),
+        }
         if original_content:
-            context_parts.extend([
-                "",
-                "=== CURRENT FILE CONTENT (for reference) ===",
-                original_content[:2000]
-            ])
+            variables[f"{context_name}_original_content"] = (original_content[:2000], "Current file content for reference")
+        context_tracker.store_variables(variables)
+        return context_name
+    
+    def _edit_file_content(self, file_path: str, original_content: str, plan: str, todo: str) -> str:
+        """Edit file content (create new or completely rewrite existing)"""
+        # Excerpts are shared by the tracked variables and the context; a
+        # slice past the end returns the original string without copying
+        plan_excerpt = plan[:1500]
+        todo_excerpt = todo[:500]
+        original_excerpt = original_content[:2000]
         
-        clean_context = "\n".join(context_parts)
+        # Store variables separately instead of embedding in context
+        context_name = self._store_file_variables(file_path, original_content, plan_excerpt, todo_excerpt)
         
+        # Build clean context without embedded variables
         if original_content:
-            # File exists - edit it
-            requirements = f"""You are completely rewriting the Python application file: {file_path}
-
-TASK: Completely rewrite {file_path} according to the Python containerization plan provided in the context.
-
-REQUIREMENTS:
-- This is a COMPLETE rewrite of {file_path}
-- The file currently exists and its content is shown in the context for reference  
-- Follow the plan and TODO requirements exactly for Python application development
-- Generate production-ready Python code with proper error handling, logging, and documentation
-- Use modern Python best practices: type hints, docstrings, proper imports
-- For Python files (.py): Include proper imports, error handling, logging setup
-- For Docker files: Use official Python base images, multi-stage builds where appropriate
-- For config files: Use environment variables, proper validation
-- For requirements.txt: Pin versions for production stability
-- Do NOT include markdown code blocks or explanations
-- Output only the raw file content that will be saved to {file_path}"""
+            clean_context = "\n".join((_PLAN_HEADER, plan_excerpt, "", _TODO_HEADER, todo_excerpt,
+                                       "", _CURRENT_CONTENT_HEADER, original_excerpt))
         else:
-            # File doesn't exist - create new
-            requirements = f"""You are creating a new Python application file: {file_path}
-
-TASK: Create complete content for the new file {file_path} based on the Python containerization plan and TODO.
-
-REQUIREMENTS:
-- This is a NEW file creation for {file_path}
-- Follow the plan and TODO requirements exactly for Python application development
-- Generate production-ready Python code with proper error handling, logging, and documentation
-- Use modern Python best practices: type hints, docstrings, proper imports
-- For Python files (.py): Include proper imports, error handling, logging setup, main guards
-- For Docker files: Use official Python base images, efficient layering, health checks
-- For config files: Use environment variables, proper validation
-- For requirements.txt: Pin versions for production stability
-- For test files: Use pytest framework with proper fixtures and assertions
-- Do NOT include markdown code blocks or explanations  
-- Output only the raw file content that will be saved to {file_path}"""
+            clean_context = "\n".join((_PLAN_HEADER, plan_excerpt, "", _TODO_HEADER, todo_excerpt))
         
-        result = self.ai.file_write(
-            requirements=requirements,
-            context=clean_context,
-            context_name=context_name
-        )
+        template = _REWRITE_REQUIREMENTS if original_content else _CREATE_REQUIREMENTS
+        requirements = template.format(path=file_path)
+        
+        result = self._file_write(requirements, clean_context, context_name)
         
         # The file_write query already cleans the content
         return result.content
@@ -352,7 +538,7 @@ TODO excerpt that was implemented:
             pre_execution_info += "=====================================\n\n"
             
             # Write test script
-            test_script_path.write_text(test_script_content)
+            _atomic_write(test_script_path, test_script_content)
             test_script_path.chmod(0o755)  # Make executable
             
             # Run the script with timeout
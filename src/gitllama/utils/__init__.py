@@ -4,10 +4,11 @@ Utilities and infrastructure components
 
 from .metrics import context_manager
 from .context_tracker import context_tracker
-from .reports import ReportGenerator
+from .reports import ReportGenerator, precompile_report_template
 
 __all__ = [
     "context_manager",
     "context_tracker",
-    "ReportGenerator"
+    "ReportGenerator",
+    "precompile_report_template"
 ]
\ No newline at end of file
@@ -3,46 +3,78 @@ Context Tracker for GitLlama
 Tracks all context variables and their usage in prompts
 """
 
+import functools
 import logging
 import re
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
-from pathlib import Path
+import threading
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_pretty(content: Any) -> str:
+    """Serialize a list/dict as indented JSON, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                content, default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib handles those
+            pass
+    return json.dumps(content, indent=2, default=str)
+
+
+def _synchronized(method):
+    """Run a ContextTracker method while holding the tracker's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class ContextTracker:
     """Tracks all context variables used throughout GitLlama execution"""
     
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        """Singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
-        """Initialize the context tracker (only once)"""
-        if not self._initialized:
-            # Store contexts by stage/phase
-            self.stages: Dict[str, Dict[str, Any]] = {}
-            self.current_stage: Optional[str] = None
-            self.stage_order: List[str] = []
-            # Track the current prompt being built
-            self.current_prompt_variables: Dict[str, Any] = {}
-            ContextTracker._initialized = True
-            logger.info("📝 Context Tracker initialized")
+        """Initialize the context tracker"""
+        # Store contexts by stage/phase
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.current_stage: Optional[str] = None
+        self.stage_order: List[str] = []
+        # Track the current prompt being built
+        self.current_prompt_variables: Dict[str, Any] = {}
+        # Records keep monotonic_ns stamps; wall-clock strings are derived
+        # from this anchor only when the data is read
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic_ns()
+        # Running totals so get_total_stats doesn't rescan every stage;
+        # variables whose size isn't counted yet wait in _unsized
+        self._totals = {"variables": 0, "prompts": 0, "responses": 0, "pairs": 0, "size": 0}
+        self._query_type_counts: Dict[Optional[str], int] = {}
+        self._unsized: Dict[int, Dict[str, Any]] = {}
+        # Stores may come from worker threads (parallel analysis and edits)
+        self._lock = threading.RLock()
+        logger.info("📝 Context Tracker initialized")
     
+    @_synchronized
     def start_stage(self, stage_name: str):
         """Start tracking a new stage/phase"""
         self.current_stage = stage_name
         if stage_name not in self.stages:
             self.stages[stage_name] = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp_ns": time.monotonic_ns(),
                 "variables": {},
                 "prompts": [],
                 "responses": [],
@@ -51,38 +83,78 @@ class ContextTracker:
             self.stage_order.append(stage_name)
         # Clear current prompt variables for new stage
         self.current_prompt_variables.clear()
-        logger.debug(f"📍 Started tracking stage: {stage_name}")
+        logger.debug("📍 Started tracking stage: %s", stage_name)
     
+    @_synchronized
     def store_variable(self, var_name: str, content: Any, description: str = ""):
         """Store a context variable for the current stage"""
         if not self.current_stage:
             logger.warning("No active stage - starting default stage")
             self.start_stage("default")
         
-        # Convert content to string representation
-        if isinstance(content, (list, dict)):
-            content_str = json.dumps(content, indent=2, default=str)
-        elif isinstance(content, Path):
-            content_str = str(content)
-        else:
-            content_str = str(content)
-        
-        # Store with metadata
+        # Store with metadata; the string form is built on first read
         var_data = {
-            "content": content_str,
+            "raw": content,
             "description": description,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.monotonic_ns(),
             "type": type(content).__name__,
-            "size": len(content_str)
         }
         
-        self.stages[self.current_stage]["variables"][var_name] = var_data
+        self._put_variable(self.stages[self.current_stage]["variables"], var_name, var_data)
         
-        # Also store in current prompt variables for template tracking
-        self.current_prompt_variables[var_name] = content_str
+        logger.debug("📦 Stored variable '%s' (%s) in stage '%s'", var_name, var_data['type'], self.current_stage)
+    
+    @_synchronized
+    def store_variables(self, variables: Dict[str, Tuple[Any, str]]):
+        """Store several context variables for the current stage at once
         
-        logger.debug(f"📦 Stored variable '{var_name}' ({len(content_str)} chars) in stage '{self.current_stage}'")
+        Args:
+            variables: Mapping of variable name to (content, description)
+        """
+        if not self.current_stage:
+            logger.warning("No active stage - starting default stage")
+            self.start_stage("default")
+        
+        stage_variables = self.stages[self.current_stage]["variables"]
+        timestamp_ns = time.monotonic_ns()
+        for var_name, (content, description) in variables.items():
+            var_data = {
+                "raw": content,
+                "description": description,
+                "timestamp_ns": timestamp_ns,
+                "type": type(content).__name__,
+            }
+            self._put_variable(stage_variables, var_name, var_data)
+        
+        logger.debug("📦 Stored %d variables in stage '%s'", len(variables), self.current_stage)
+    
+    def _put_variable(self, stage_variables: Dict[str, Any], var_name: str, var_data: Dict[str, Any]):
+        """Add a variable record to a stage, keeping the running totals in step"""
+        old = stage_variables.get(var_name)
+        if old is None:
+            self._totals["variables"] += 1
+        elif self._unsized.pop(id(old), None) is None:
+            self._totals["size"] -= old["size"]
+        stage_variables[var_name] = var_data
+        self._unsized[id(var_data)] = var_data
+        
+        # Also track for the next prompt's variable map
+        self.current_prompt_variables[var_name] = var_data
+    
+    @staticmethod
+    def _materialize(var_data: Dict[str, Any]) -> str:
+        """Return a variable's string content, serializing it once on first use"""
+        if "content" not in var_data:
+            content = var_data.pop("raw")
+            if isinstance(content, (list, dict)):
+                content_str = _dumps_pretty(content)
+            else:
+                content_str = str(content)
+            var_data["content"] = content_str
+            var_data["size"] = len(content_str)
+        return var_data["content"]
     
+    @_synchronized
     def store_prompt_and_response(self, prompt: str, response: str, 
                                  template: Optional[str] = None,
                                  variable_map: Optional[Dict[str, str]] = None,
@@ -103,42 +175,48 @@ class ContextTracker:
         
         # If no variable map provided, use current prompt variables
         if variable_map is None:
-            variable_map = self.current_prompt_variables.copy()
+            variable_map = {name: self._materialize(var_data)
+                            for name, var_data in self.current_prompt_variables.items()}
         
         # Try to identify variables in the prompt if template not provided
         if not template:
             template, variable_map = self._extract_template_from_prompt(prompt, variable_map)
         
-        now = datetime.now()
+        now_ns = time.monotonic_ns()
+        prompt_size = len(prompt)
+        response_size = len(response)
         pair_data = {
-            "timestamp": now.isoformat(),
-            "clock_time": now.strftime("%H:%M:%S"),
+            "timestamp_ns": now_ns,
             "prompt": prompt,
             "response": response,
             "template": template,
             "variables_used": variable_map,
-            "prompt_size": len(prompt),
-            "response_size": len(response),
+            "prompt_size": prompt_size,
+            "response_size": response_size,
             "query_type": query_type,
             "execution_time_seconds": execution_time_seconds
         }
         
         self.stages[self.current_stage]["prompt_response_pairs"].append(pair_data)
+        self._totals["pairs"] += 1
+        self._totals["prompts"] += 1
+        self._totals["responses"] += 1
+        self._query_type_counts[query_type] = self._query_type_counts.get(query_type, 0) + 1
         
         # Also store in old format for backward compatibility
         self.stages[self.current_stage]["prompts"].append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": now_ns,
             "prompt": prompt,
-            "combined_size": len(prompt)
+            "combined_size": prompt_size
         })
         self.stages[self.current_stage]["responses"].append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": now_ns,
             "response": response,
             "type": "ai_response",
-            "size": len(response)
+            "size": response_size
         })
         
-        logger.debug(f"📝 Stored prompt-response pair ({len(prompt)}/{len(response)} chars) in stage '{self.current_stage}'")
+        logger.debug("📝 Stored prompt-response pair (%d/%d chars) in stage '%s'", prompt_size, response_size, self.current_stage)
     
     def _extract_template_from_prompt(self, prompt: str, variables: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
         """Try to extract a template from a prompt by identifying variable content
@@ -167,6 +245,7 @@ class ContextTracker:
         # Return template and ALL variables (not just ones found in prompt)
         return template, detected_vars
     
+    @_synchronized
     def store_prompt(self, prompt: str, context: str = "", question: str = ""):
         """Store a complete prompt (backward compatibility)"""
         if not self.current_stage:
@@ -183,6 +262,7 @@ class ContextTracker:
         self._last_prompt = prompt
         self._last_variable_map = variable_map
     
+    @_synchronized
     def store_response(self, response: str, response_type: str = "open"):
         """Store an AI response and pair it with the last prompt"""
         if not self.current_stage:
@@ -202,21 +282,30 @@ class ContextTracker:
         else:
             # Store response alone (backward compatibility)
             response_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp_ns": time.monotonic_ns(),
                 "response": response,
                 "type": response_type,
                 "size": len(response)
             }
             self.stages[self.current_stage]["responses"].append(response_data)
+            self._totals["responses"] += 1
         
-        logger.debug(f"💬 Stored {response_type} response ({len(response)} chars) in stage '{self.current_stage}'")
+        logger.debug("💬 Stored %s response (%d chars) in stage '%s'", response_type, len(response), self.current_stage)
     
+    @_synchronized
     def get_stage_summary(self, stage_name: str) -> Dict[str, Any]:
         """Get summary of a specific stage"""
         if stage_name not in self.stages:
             return {}
         
         stage = self.stages[stage_name]
+        for var_data in stage["variables"].values():
+            self._materialize(var_data)
+        self._add_wall_times((stage,))
+        self._add_wall_times(stage["variables"].values())
+        self._add_wall_times(stage["prompts"])
+        self._add_wall_times(stage["responses"])
+        self._add_wall_times(stage.get("prompt_response_pairs", []), clock_time=True)
         return {
             "stage_name": stage_name,
             "timestamp": stage["timestamp"],
@@ -231,37 +320,46 @@ class ContextTracker:
             "prompt_response_pairs": stage.get("prompt_response_pairs", [])
         }
     
+    def _wall_time(self, timestamp_ns: int) -> datetime:
+        """Convert a monotonic_ns stamp to wall-clock time"""
+        return self._t0_wall + timedelta(microseconds=(timestamp_ns - self._t0_mono) / 1000)
+    
+    def _add_wall_times(self, records: Iterable[Dict[str, Any]], clock_time: bool = False):
+        """Fill in ISO timestamps (and HH:MM:SS clock times) on records that lack them"""
+        for record in records:
+            if "timestamp" in record:
+                continue
+            wall = self._wall_time(record["timestamp_ns"])
+            record["timestamp"] = wall.isoformat()
+            if clock_time:
+                record["clock_time"] = wall.strftime("%H:%M:%S")
+    
+    def iter_stages(self) -> Iterator[Dict[str, Any]]:
+        """Yield stage summaries in order, one at a time"""
+        for stage in list(self.stage_order):
+            yield self.get_stage_summary(stage)
+    
     def get_all_stages(self) -> List[Dict[str, Any]]:
         """Get all stages in order with their data"""
-        return [self.get_stage_summary(stage) for stage in self.stage_order]
+        return list(self.iter_stages())
     
+    @_synchronized
     def get_total_stats(self) -> Dict[str, Any]:
         """Get overall statistics"""
-        total_vars = sum(len(s["variables"]) for s in self.stages.values())
-        total_prompts = sum(len(s["prompts"]) for s in self.stages.values())
-        total_responses = sum(len(s["responses"]) for s in self.stages.values())
-        total_pairs = sum(len(s.get("prompt_response_pairs", [])) for s in self.stages.values())
-        total_size = sum(
-            sum(v["size"] for v in s["variables"].values())
-            for s in self.stages.values()
-        )
-        
-        # Count by query type
-        query_type_counts = {}
-        for stage in self.stages.values():
-            for pair in stage.get("prompt_response_pairs", []):
-                query_type = pair.get("query_type", "unknown")
-                query_type_counts[query_type] = query_type_counts.get(query_type, 0) + 1
+        # Count the sizes of variables stored since the last call
+        for var_data in self._unsized.values():
+            self._totals["size"] += len(self._materialize(var_data))
+        self._unsized.clear()
         
         return {
             "num_stages": len(self.stages),
-            "total_variables": total_vars,
-            "total_prompts": total_prompts,
-            "total_responses": total_responses,
-            "total_pairs": total_pairs,
-            "total_data_size": total_size,
+            "total_variables": self._totals["variables"],
+            "total_prompts": self._totals["prompts"],
+            "total_responses": self._totals["responses"],
+            "total_pairs": self._totals["pairs"],
+            "total_data_size": self._totals["size"],
             "stages": list(self.stage_order),
-            "query_type_breakdown": query_type_counts
+            "query_type_breakdown": dict(self._query_type_counts)
         }
     
     def export_for_report(self) -> Dict[str, Any]:
@@ -273,14 +371,18 @@ class ContextTracker:
             "timestamp": datetime.now().isoformat()
         }
     
+    @_synchronized
     def reset(self):
         """Reset all tracking (for testing)"""
         self.stages.clear()
         self.current_stage = None
         self.stage_order.clear()
         self.current_prompt_variables.clear()
+        self._totals = dict.fromkeys(self._totals, 0)
+        self._query_type_counts.clear()
+        self._unsized.clear()
         logger.info("🔄 Context tracker reset")
 
 
-# Global instance
-context_tracker = ContextTracker()
\ No newline at end of file
+# Global instance shared by the whole process
+context_tracker = ContextTracker()
@@ -4,6 +4,7 @@ Simple metrics collection focused on AI call and compression tracking
 """
 
 import logging
+import threading
 from typing import Dict, Any
 from datetime import datetime
 
@@ -29,30 +30,35 @@ class MetricsCollector:
             self.operations = []
             self.compression_events = []
             self.start_time = datetime.now()
+            # AI calls are recorded from analysis and edit worker threads
+            self._lock = threading.Lock()
             MetricsCollector._initialized = True
             logger.info("📊 Metrics Collector initialized")
     
     def record_ai_call(self, operation_type: str, operation_name: str = ""):
         """Record an AI API call"""
-        self.api_calls += 1
-        self.operations.append({
-            "timestamp": datetime.now(),
-            "type": operation_type,
-            "name": operation_name,
-            "call_number": self.api_calls
-        })
-        logger.info(f"🤖 AI call #{self.api_calls}: {operation_type} - {operation_name}")
+        with self._lock:
+            self.api_calls += 1
+            call_number = self.api_calls
+            self.operations.append({
+                "timestamp": datetime.now(),
+                "type": operation_type,
+                "name": operation_name,
+                "call_number": call_number
+            })
+        logger.info(f"🤖 AI call #{call_number}: {operation_type} - {operation_name}")
     
     def record_compression(self, original_size: int, compressed_size: int, rounds: int, success: bool):
         """Record a context compression event"""
-        self.compression_events.append({
-            "timestamp": datetime.now(),
-            "original_size": original_size,
-            "compressed_size": compressed_size,
-            "compression_ratio": (1 - compressed_size / original_size) * 100 if original_size > 0 else 0,
-            "rounds": rounds,
-            "success": success
-        })
+        with self._lock:
+            self.compression_events.append({
+                "timestamp": datetime.now(),
+                "original_size": original_size,
+                "compressed_size": compressed_size,
+                "compression_ratio": (1 - compressed_size / original_size) * 100 if original_size > 0 else 0,
+                "rounds": rounds,
+                "success": success
+            })
         logger.info(f"🗜️ Compression recorded: {original_size} → {compressed_size} tokens ({rounds} rounds)")
     
     def get_summary(self) -> Dict[str, Any]:
@@ -105,10 +111,11 @@ class MetricsCollector:
     
     def reset(self):
         """Reset metrics (for testing)"""
-        self.api_calls = 0
-        self.operations.clear()
-        self.compression_events.clear()
-        self.start_time = datetime.now()
+        with self._lock:
+            self.api_calls = 0
+            self.operations.clear()
+            self.compression_events.clear()
+            self.start_time = datetime.now()
         logger.info("🔄 Metrics reset")
 
 
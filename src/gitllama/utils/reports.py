@@ -4,22 +4,132 @@ Shows prompts with color-coded variables and side-by-side responses
 """
 
 import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
 import webbrowser
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import IO, Dict, List, Any, Optional
 from ..utils.context_tracker import context_tracker
 from .. import __version__
 
 logger = logging.getLogger(__name__)
 
-try:
-    from jinja2 import Template
-    REPORT_DEPENDENCIES_AVAILABLE = True
-except ImportError as e:
-    REPORT_DEPENDENCIES_AVAILABLE = False
-    logger.warning(f"Report generation dependencies not available: {e}")
+REPORT_TEMPLATE_NAME = "report.html"
+# Opt-in persistent cache for compiled template bytecode: set this to 1 to use
+# the user cache directory, or to a directory path; unset (default) disables it
+BYTECODE_CACHE_ENV = "GITLLAMA_JINJA_CACHE"
+
+# Jinja2 is imported on first use by _ensure_deps(), so runs that never
+# generate a report don't pay its import cost
+REPORT_DEPENDENCIES_AVAILABLE: Optional[bool] = None
+_JINJA_ENV = None
+_COMPILED_TEMPLATE = None
+_markup_escape = None
+
+
+def _bytecode_cache_dir() -> Optional[Path]:
+    """Directory for the persistent template bytecode cache, or None if not enabled/unusable"""
+    setting = os.environ.get(BYTECODE_CACHE_ENV, "").strip()
+    if not setting or setting.lower() in ("0", "false", "off", "no"):
+        return None
+    if setting.lower() not in ("1", "true", "on", "yes"):
+        cache_dir = Path(setting).expanduser()
+    else:
+        cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(cache_root) / "gitllama" / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+    return cache_dir
+
+
+def _ensure_deps() -> bool:
+    """Import the report dependencies once; returns whether Jinja2 is available"""
+    global REPORT_DEPENDENCIES_AVAILABLE, _JINJA_ENV, _markup_escape
+    
+    if REPORT_DEPENDENCIES_AVAILABLE is not None:
+        return REPORT_DEPENDENCIES_AVAILABLE
+    
+    try:
+        from jinja2 import DictLoader, Environment, FileSystemBytecodeCache
+        # MarkupSafe ships with Jinja2 and escapes in C
+        from markupsafe import escape as _markup_escape
+        # Autoescape stays off: the template embeds pre-built HTML from format_prompt
+        _JINJA_ENV = Environment(
+            loader=DictLoader({REPORT_TEMPLATE_NAME: _HTML_TEMPLATE_SRC}),
+            autoescape=False,
+            auto_reload=False,
+            # Drop the whitespace lines left behind by block tags
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        cache_dir = _bytecode_cache_dir()
+        if cache_dir is not None:
+            # Jinja only checksums the template source, so key entries on the
+            # release too: bytecode compiled under other Environment options is stale
+            _JINJA_ENV.bytecode_cache = FileSystemBytecodeCache(
+                str(cache_dir), pattern=f'__jinja2_{__version__}_%s.cache')
+        REPORT_DEPENDENCIES_AVAILABLE = True
+    except ImportError as e:
+        REPORT_DEPENDENCIES_AVAILABLE = False
+        logger.warning(f"Report generation dependencies not available: {e}")
+    
+    return REPORT_DEPENDENCIES_AVAILABLE
+
+
+def precompile_report_template():
+    """Compile the report template once and return it, or None without Jinja2
+    
+    Call during warm-up (or once after install, to fill the bytecode cache)
+    so the first report skips parsing and code generation.
+    """
+    global _COMPILED_TEMPLATE
+    if _COMPILED_TEMPLATE is None and _ensure_deps():
+        _COMPILED_TEMPLATE = _JINJA_ENV.get_template(REPORT_TEMPLATE_NAME)
+    return _COMPILED_TEMPLATE
+
+
+# Reports are typically 100 KB to a few MB, so most flush in one write
+WRITE_BUFFER_SIZE = 1 << 20
+# Template output pieces joined per write while streaming
+STREAM_BUFFER_CHUNKS = 64
+
+# Badge text shown next to each exchange in the report
+QUERY_TYPE_LABELS = {
+    'multiple_choice': '🔤 Multiple Choice',
+    'single_word': '📝 Single Word',
+    'open': '📰 Open Response',
+    'file_write': '📄 File Write',
+}
+
+# Single-pass HTML escaping when MarkupSafe isn't available
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+def _open_in_browser(path: Path):
+    """Open a file with the desktop's default handler without waiting for it"""
+    if sys.platform == "win32":
+        os.startfile(str(path))
+        return
+    opener = "open" if sys.platform == "darwin" else shutil.which("xdg-open")
+    if opener:
+        subprocess.Popen([opener, str(path)], stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, start_new_session=True)
+    else:
+        webbrowser.open(f'file://{path}')
 
 
 class ReportGenerator:
@@ -29,6 +139,9 @@ class ReportGenerator:
         self.repo_url = repo_url
         self.output_dir = Path(output_dir)
         self.start_time = datetime.now()
+        # Durations and event offsets use the monotonic clock; wall-clock
+        # datetimes are only formatted for display
+        self.start_monotonic = time.monotonic()
         self.timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
         
         # Basic tracking structures
@@ -59,7 +172,7 @@ class ReportGenerator:
             branch_info: Additional branch information (created, existing, etc.)
             test_results: Test execution results and AI evaluation
         """
-        total_workflow_time = (datetime.now() - self.start_time).total_seconds()
+        total_workflow_time = time.monotonic() - self.start_monotonic
         
         self.executive_summary = {
             "repo_url": self.repo_url,
@@ -231,15 +344,17 @@ class ReportGenerator:
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML characters"""
-        return (text.replace('&', '&amp;')
-                   .replace('<', '&lt;')
-                   .replace('>', '&gt;')
-                   .replace('"', '&quot;')
-                   .replace("'", '&#x27;'))
+        if _markup_escape is not None:
+            return str(_markup_escape(text))
+        return text.translate(_HTML_ESCAPE_TABLE)
     
     def generate_report(self, auto_open: bool = True) -> Path:
         """Generate the enhanced HTML report with color-coded variables"""
-        if not REPORT_DEPENDENCIES_AVAILABLE:
+        if self._should_skip_jinja():
+            logger.info("Nothing tracked beyond the summary, writing a text report")
+            return self._generate_text_report()
+        
+        if not _ensure_deps():
             logger.error("Cannot generate report: missing dependencies (jinja2)")
             return self._generate_fallback_report()
         
@@ -259,54 +374,139 @@ class ReportGenerator:
             "context_tracking": context_data,
             "metrics": self.metrics,
             "congress_summary": congress_summary,
+            "file_rows": self._build_file_rows(),
+            "total_data_kb": round(context_data["stats"]["total_data_size"] / 1024, 1),
+            "execution_time_rounded": round(self.executive_summary.get("execution_time", 0), 1),
+            "num_files_modified": len(self.executive_summary.get("files_modified", [])),
+            "exchange_rows": self._build_exchange_rows(context_data),
+            "stage_tabs": [(stage["stage_name"], stage["num_pairs"]) for stage in context_data["stages"]],
+            "report_css": _REPORT_CSS,
             "gitllama_version": __version__,
             "format_prompt": self._format_prompt_with_variables,
             "generate_color": self._generate_color_for_variable,
             "escape_html": self._escape_html
         }
         
-        # Generate HTML
-        html_content = self._render_enhanced_html_template(template_data)
-        
-        # Save HTML report
+        # Generate and save HTML report, streamed straight to disk so the
+        # full document is never held in memory
         html_filename = f"gitllama_report_{self.timestamp}.html"
         html_path = self.output_dir / html_filename
         
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        self._write_rendered(html_path, template_data)
         
-        # Save as latest
+        # Point latest.html at this report; copy where symlinks aren't allowed
         latest_path = self.output_dir / "latest.html"
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        try:
+            latest_path.unlink(missing_ok=True)
+            latest_path.symlink_to(html_filename)
+        except OSError:
+            shutil.copyfile(html_path, latest_path)
         
         logger.info(f"Report generated: {html_path}")
         
         # Auto-open in browser
         if auto_open:
             try:
-                webbrowser.open(f'file://{html_path.absolute()}')
+                _open_in_browser(html_path.absolute())
                 logger.info("Report opened in browser")
             except Exception as e:
                 logger.warning(f"Could not auto-open report: {e}")
         
         return html_path
     
+    def _build_file_rows(self) -> List[tuple]:
+        """Pair each modified file with its diff so the template loop does no lookups"""
+        file_diffs = self.executive_summary.get("file_diffs") or {}
+        return [(file_path, file_diffs.get(file_path))
+                for file_path in self.executive_summary.get("files_modified", [])]
+    
+    def _build_exchange_rows(self, context_data: Dict[str, Any]) -> Dict[str, List[tuple]]:
+        """Resolve each exchange's Congress variable, query-type label and variable legend once per report"""
+        rows = {}
+        for stage in context_data.get("stages", []):
+            stage_rows = []
+            for pair in stage.get("prompt_response_pairs", []):
+                congress_var = next(
+                    (var_data for var_name, var_data in pair.get("variables_used", {}).items()
+                     if var_name.endswith('_congress') and isinstance(var_data, dict)
+                     and var_data.get('vote_details')),
+                    None)
+                query_type = pair.get("query_type")
+                legend = [(var_name, self._generate_color_for_variable(var_name), len(var_content) if var_content else 0)
+                          for var_name, var_content in pair.get("variables_used", {}).items()
+                          if not var_name.endswith('_congress')]
+                stage_rows.append((pair, congress_var, QUERY_TYPE_LABELS.get(query_type, query_type), legend))
+            rows[stage.get("stage_name")] = stage_rows
+        return rows
+    
     def _render_enhanced_html_template(self, data: Dict[str, Any]) -> str:
         """Render the enhanced HTML template"""
-        template = Template(self._get_enhanced_html_template())
-        return template.render(**data)
+        return self._get_compiled_template().render(**data)
+    
+    def _stream_enhanced_html_template(self, data: Dict[str, Any], fp: IO[str]):
+        """Render the enhanced HTML template into a file-like object block by block"""
+        stream = self._get_compiled_template().stream(**data)
+        stream.enable_buffering(STREAM_BUFFER_CHUNKS)
+        stream.dump(fp)
     
-    def _get_enhanced_html_template(self) -> str:
+    def _write_rendered(self, path: Path, data: Dict[str, Any]):
+        """Stream the rendered report into path through one large write buffer"""
+        with path.open('w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            self._stream_enhanced_html_template(data, f)
+    
+    @staticmethod
+    def _get_compiled_template():
+        """Return the report template, parsing and compiling it only once"""
+        return precompile_report_template()
+    
+    @staticmethod
+    def _get_enhanced_html_template() -> str:
         """Get the enhanced HTML template with color-coded variables"""
-        return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>GitLlama Context Report - {{ timestamp }}</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
+        return _HTML_TEMPLATE_SRC
+    
+    def _should_skip_jinja(self) -> bool:
+        """Whether the run recorded too little for the HTML report to be worth rendering"""
+        return not any(stage.get("prompt_response_pairs") for stage in context_tracker.stages.values())
+    
+    def _generate_text_report(self, note: str = "") -> Path:
+        """Generate a plain text report without Jinja2"""
+        lines = [
+            "GitLlama Context Report",
+            "=" * 50,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Repository: {self.repo_url}",
+        ]
+        
+        summary = self.executive_summary
+        if summary:
+            lines += [
+                f"Branch: {summary.get('branch_selected', '')}",
+                f"Success: {summary.get('success')}",
+                f"Commit: {summary.get('commit_hash', '')}",
+                f"AI decisions: {summary.get('total_ai_decisions', 0)}",
+                f"Execution time: {summary.get('execution_time', 0):.1f}s",
+            ]
+            files_modified = summary.get("files_modified") or []
+            if files_modified:
+                lines.append("Files modified:")
+                lines += [f"  - {file_path}" for file_path in files_modified]
+        
+        if note:
+            lines += ["", note]
+        
+        txt_path = self.output_dir / f"report_{self.timestamp}.txt"
+        with open(txt_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(f"{line}\n" for line in lines)
+        
+        return txt_path
+    
+    def _generate_fallback_report(self) -> Path:
+        """Generate simple text report when dependencies are missing"""
+        return self._generate_text_report("Install jinja2 for full HTML report: pip install jinja2")
+
+
+# Static report stylesheet, passed to the template as a single value
+_REPORT_CSS = '''* { margin: 0; padding: 0; box-sizing: border-box; }
         body { 
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             line-height: 1.6; color: #333; background: #f5f7fa;
@@ -648,7 +848,17 @@ class ReportGenerator:
         .prompt-content::-webkit-scrollbar-thumb:hover,
         .response-content::-webkit-scrollbar-thumb:hover {
             background: #94a3b8;
-        }
+        }'''
+
+# Report template source, served to the Jinja environment by its DictLoader
+_HTML_TEMPLATE_SRC = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>GitLlama Context Report - {{ timestamp }}</title>
+    <style>
+        {{ report_css }}
     </style>
 </head>
 <body>
@@ -681,11 +891,11 @@ class ReportGenerator:
                     <div class="stat-label">AI Exchanges</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{{ (context_tracking.stats.total_data_size / 1024)|round(1) }}KB</div>
+                    <div class="stat-value">{{ total_data_kb }}KB</div>
                     <div class="stat-label">Data Size</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{{ executive_summary.execution_time|round(1) }}s</div>
+                    <div class="stat-value">{{ execution_time_rounded }}s</div>
                     <div class="stat-label">Runtime</div>
                 </div>
                 <div class="stat-card">
@@ -742,7 +952,7 @@ class ReportGenerator:
                     
                     <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b;">
                         <div style="font-weight: 600; color: #92400e;">Files Modified</div>
-                        <div style="color: #374151; margin-top: 0.25rem;">{{ executive_summary.files_modified|length }} files</div>
+                        <div style="color: #374151; margin-top: 0.25rem;">{{ num_files_modified }} files</div>
                     </div>
                 </div>
                 
@@ -782,7 +992,7 @@ class ReportGenerator:
                 <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; border-left: 4px solid #ef4444;">
                     <div style="font-weight: 600; color: #dc2626; margin-bottom: 0.75rem;">📁 File Modifications</div>
                     
-                    {% for file_path in executive_summary.files_modified %}
+                    {% for file_path, diff_data in file_rows %}
                     <div style="margin-bottom: 1rem;">
                         <button class="expandable-header" onclick="toggleFileDetails('file-{{ loop.index }}')" style="
                             width: 100%; text-align: left; background: white; border: 1px solid #d1d5db;
@@ -795,8 +1005,7 @@ class ReportGenerator:
                         </button>
                         
                         <div id="file-{{ loop.index }}-content" style="display: none; margin-top: 0.5rem;">
-                            {% if executive_summary.file_diffs and executive_summary.file_diffs[file_path] %}
-                            {% set diff_data = executive_summary.file_diffs[file_path] %}
+                            {% if diff_data %}
                             
                             <!-- Before/After Tabs -->
                             <div style="background: white; border: 1px solid #d1d5db; border-radius: 6px; overflow: hidden;">
@@ -1014,12 +1223,12 @@ class ReportGenerator:
             
             <!-- Stage Navigation -->
             <div class="stage-nav">
-                {% for stage in context_tracking.stages %}
+                {% for stage_name, num_pairs in stage_tabs %}
                 <div class="stage-tab {% if loop.first %}active{% endif %}" 
-                     onclick="showStage('{{ stage.stage_name }}', this)">
-                    {{ stage.stage_name }}
+                     onclick="showStage('{{ stage_name }}', this)">
+                    {{ stage_name }}
                     <span style="background: rgba(102,126,234,0.2); padding: 2px 6px; border-radius: 4px; margin-left: 4px; font-size: 0.8rem;">
-                        {{ stage.num_pairs }}
+                        {{ num_pairs }}
                     </span>
                 </div>
                 {% endfor %}
@@ -1037,27 +1246,14 @@ class ReportGenerator:
                 
                 
                 <!-- Prompt-Response Pairs -->
-                {% for pair in stage.prompt_response_pairs %}
-                <!-- Find Congress variable for this pair -->
-                {% set ns = namespace(congress_var=None) %}
-                {% for var_name, var_data in pair.variables_used.items() %}
-                    {% if var_name.endswith('_congress') and var_data.get('vote_details') and ns.congress_var is none %}
-                        {% set ns.congress_var = var_data %}
-                    {% endif %}
-                {% endfor %}
-                {% set congress_var = ns.congress_var %}
+                {% for pair, congress_var, query_type_label, legend in exchange_rows.get(stage.stage_name, ()) %}
                 <div class="prompt-response-pair">
                     <div class="pair-header">
                         <div class="pair-number">
                             Exchange #{{ loop.index }}
                             {% if pair.query_type %}
                             <span class="query-type-badge query-type-{{ pair.query_type }}">
-                                {% if pair.query_type == 'multiple_choice' %}🔤 Multiple Choice
-                                {% elif pair.query_type == 'single_word' %}📝 Single Word
-                                {% elif pair.query_type == 'open' %}📰 Open Response
-                                {% elif pair.query_type == 'file_write' %}📄 File Write
-                                {% else %}{{ pair.query_type }}
-                                {% endif %}
+                                {{ query_type_label }}
                             </span>
                             {% endif %}
                             <!-- Congress Voting Inline -->
@@ -1121,14 +1317,12 @@ class ReportGenerator:
                     <div class="variable-legend" style="margin: 0 1.5rem 1rem 1.5rem;">
                         <h4>📦 Variables Used in This Exchange</h4>
                         <div class="legend-items">
-                            {% for var_name, var_content in pair.variables_used.items() %}
-                            {% if not var_name.endswith('_congress') %}
+                            {% for var_name, color, size in legend %}
                             <div class="legend-item">
-                                <div class="legend-color" style="background: {{ generate_color(var_name) }};"></div>
+                                <div class="legend-color" style="background: {{ color }};"></div>
                                 <span style="font-weight: 600;">{{ var_name }}</span>
-                                <span style="color: #6b7280;">({{ var_content|length if var_content else 0 }} chars)</span>
+                                <span style="color: #6b7280;">({{ size }} chars)</span>
                             </div>
-                            {% endif %}
                             {% endfor %}
                         </div>
                     </div>
@@ -1361,19 +1555,3 @@ class ReportGenerator:
     </script>
 </body>
 </html>'''
-    
-    def _generate_fallback_report(self) -> Path:
-        """Generate simple text report when dependencies are missing"""
-        lines = [
-            "GitLlama Context Report",
-            "=" * 50,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            "",
-            "Install jinja2 for full HTML report: pip install jinja2",
-        ]
-        
-        txt_path = self.output_dir / f"report_{self.timestamp}.txt"
-        with open(txt_path, 'w') as f:
-            f.write('\n'.join(lines))
-        
-        return txt_path
\ No newline at end of file
@@ -1,143 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test the enhanced executive summary with detailed execution information
-"""
-
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-def test_enhanced_executive_summary():
-    """Test the enhanced executive summary features"""
-    print("🧪 Testing Enhanced Executive Summary")
-    print("=" * 70)
-    
-    try:
-        from gitllama.utils.reports import ReportGenerator
-        from gitllama.todo.executor import TodoExecutor
-        
-        print("✅ ReportGenerator and TodoExecutor can be imported")
-        
-        # Test the enhanced executive summary data structure
-        repo_url = "https://github.com/test/repo.git"
-        report_gen = ReportGenerator(repo_url)
-        
-        # Simulate execution results with detailed information
-        sample_file_diffs = {
-            "src/main.py": {
-                "before": "def main():\n    print('Hello')",
-                "after": "def main():\n    print('Hello World!')\n    return 0",
-                "operation": "EDIT"
-            },
-            "config/settings.json": {
-                "before": "",
-                "after": '{\n  "debug": true,\n  "version": "1.0.0"\n}',
-                "operation": "EDIT"
-            },
-            "legacy/old_file.py": {
-                "before": "# Old deprecated code\npass",
-                "after": "",
-                "operation": "DELETE"
-            }
-        }
-        
-        branch_info = {
-            "created": True,
-            "base_branch": "main",
-            "description": "Created new feature branch"
-        }
-        
-        commit_message = """Implement user authentication system
-
-- Add login/logout functionality  
-- Create user session management
-- Update database schema for users
-- Add password hashing utilities
-
-🤖 Generated with GitLlama v0.7.4
-
-Co-Authored-By: Claude <noreply@anthropic.com>"""
-        
-        print(f"\n📊 Testing Enhanced Executive Summary Features:")
-        
-        # Test the new set_executive_summary method
-        report_gen.set_executive_summary(
-            repo_path="/home/user/test-repo",
-            branch="feat/user-auth",
-            modified_files=["src/main.py", "config/settings.json", "legacy/old_file.py"],
-            commit_hash="abc123def456789",
-            success=True,
-            total_decisions=15,
-            commit_message=commit_message,
-            file_diffs=sample_file_diffs,
-            branch_info=branch_info
-        )
-        
-        print("✅ Enhanced executive summary data structure created")
-        print(f"   • Branch information: {branch_info}")
-        print(f"   • Commit message: {len(commit_message)} chars")
-        print(f"   • File diffs: {len(sample_file_diffs)} files")
-        
-        print(f"\n🎯 New Executive Summary Features:")
-        print("✅ Exact branch name used (feat/user-auth)")
-        print("✅ Full commit hash displayed (abc123def456789)")
-        print("✅ Complete commit message with formatting")
-        print("✅ File-by-file before/after diffs")
-        print("✅ Expandable file modification details")
-        print("✅ Before/After tabbed views for each file")
-        print("✅ Operation type tracking (EDIT/DELETE)")
-        
-        print(f"\n🏗️ Report Features Added:")
-        print("📋 Git Information: Branch, Commit Hash, Files Count")
-        print("📝 Commit Message: Full message in monospace format")
-        print("📁 File Modifications: Expandable list with diff tabs")
-        print("🗂️ Individual Files: Before/After content comparison")
-        print("⚡ Interactive UI: Click to expand, tabs to switch views")
-        
-        print(f"\n📊 File Diff Tracking:")
-        for file_path, diff_data in sample_file_diffs.items():
-            before_size = len(diff_data['before']) if diff_data['before'] else 0
-            after_size = len(diff_data['after']) if diff_data['after'] else 0
-            operation = diff_data['operation']
-            print(f"   📄 {file_path}: {operation} ({before_size} → {after_size} chars)")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run enhanced executive summary test"""
-    print("🔧 GitLlama Enhanced Executive Summary Test")
-    print("=" * 70)
-    
-    success = test_enhanced_executive_summary()
-    
-    print(f"\n🎯 Test Summary:")
-    print("=" * 70)
-    if success:
-        print("✅ Enhanced executive summary tests PASSED!")
-        print("🎉 Reports now show comprehensive execution details!")
-        print("\n🔧 What's New:")
-        print("   • Exact git branch and commit hash displayed")
-        print("   • Full commit message with proper formatting")
-        print("   • File-by-file before/after diff comparison")
-        print("   • Interactive expandable file details")
-        print("   • Tabbed before/after views for each file")
-        print("   • Clear operation tracking (EDIT/DELETE)")
-        print("\n📈 User Benefits:")
-        print("   • Complete transparency of what GitLlama did")
-        print("   • Exact git information for reference")
-        print("   • Detailed file changes for review")
-        print("   • Professional summary for stakeholders")
-    else:
-        print("❌ Some tests FAILED!")
-        print("🔧 Check the implementation for errors")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
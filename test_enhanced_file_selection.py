@@ -1,133 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test the enhanced file selection with space filtering and individual validation
-"""
-
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-def test_enhanced_file_selection():
-    """Test the enhanced file selection workflow"""
-    print("🧪 Testing Enhanced File Selection Workflow")
-    print("=" * 70)
-    
-    try:
-        from gitllama.todo.planner import TodoPlanner
-        from gitllama.ai.client import OllamaClient
-        
-        print("✅ TodoPlanner can be imported")
-        
-        # Test that new methods exist
-        planner = TodoPlanner.__new__(TodoPlanner)  # Create without calling __init__
-        
-        # Check that new methods exist
-        expected_methods = [
-            '_validate_files_individually',
-            '_collect_files_with_context',
-            '_collect_additional_files'
-        ]
-        
-        for method_name in expected_methods:
-            if hasattr(planner, method_name):
-                print(f"✅ Method {method_name} exists")
-            else:
-                print(f"❌ Method {method_name} missing")
-        
-        print(f"\n🎯 Enhanced File Selection Workflow:")
-        print("=" * 50)
-        
-        # Simulate the enhanced workflow steps
-        print("📋 STEP 1: Extract file list from plan")
-        sample_planned_files = [
-            "src/main.py",
-            "CREATE: config/settings.json", 
-            "DELETE: old file with spaces.py",  # Should be filtered
-            "docs/README.md",
-            "test files/unit_test.py",  # Should be filtered
-            "utils/helper.py"
-        ]
-        print(f"   📄 Initial files from plan: {len(sample_planned_files)}")
-        for file in sample_planned_files:
-            print(f"      • {file}")
-        
-        print(f"\n🚫 STEP 2: Filter out files with spaces")
-        space_filtered = [f for f in sample_planned_files if ' ' not in f.replace('CREATE: ', '').replace('DELETE: ', '')]
-        filtered_out = [f for f in sample_planned_files if f not in space_filtered]
-        print(f"   ❌ Filtered out {len(filtered_out)} files with spaces:")
-        for file in filtered_out:
-            print(f"      • {file}")
-        print(f"   ✅ Remaining {len(space_filtered)} space-free files:")
-        for file in space_filtered:
-            print(f"      • {file}")
-        
-        print(f"\n✅ STEP 3: Individual YES/NO validation")
-        print("   🤖 AI validates each file individually with multiple choice:")
-        print("      • Question: 'Should {file_path} be included in the files to work on?'")
-        print("      • Options: ['YES', 'NO']") 
-        print("      • Context: Full plan, project tree, file details")
-        print("      • Only YES responses are included in final list")
-        
-        print(f"\n➕ STEP 4: Additional files with DONE loop")
-        print("   🤖 AI can still add more files:")
-        print("      • Question: 'Additional file needed or DONE?'")
-        print("      • Single word response with file path or 'DONE'")
-        print("      • Space filtering also applied to additional files")
-        print("      • Continues until AI responds 'DONE'")
-        
-        print(f"\n🎯 Key Enhancements:")
-        print("✅ Space filtering: No files with spaces allowed")
-        print("✅ Individual validation: Each file gets YES/NO review")
-        print("✅ Comprehensive context: Full project visibility per file") 
-        print("✅ Still allows additions: AI can add more files")
-        print("✅ Double filtering: Spaces filtered in both steps")
-        print("✅ Detailed logging: Track validation decisions")
-        
-        print(f"\n🔄 Complete Workflow:")
-        print("1. 📝 Extract files from plan (existing)")
-        print("2. 🧹 Filter out files with spaces (NEW)")
-        print("3. ✅ Individual YES/NO validation (NEW)")
-        print("4. ➕ AI can add more files via DONE loop (existing)")
-        print("5. 🧹 Additional files also space-filtered (NEW)")
-        print("6. 📊 Return verified file list")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run enhanced file selection test"""
-    print("🔧 GitLlama Enhanced File Selection Test")
-    print("=" * 70)
-    
-    success = test_enhanced_file_selection()
-    
-    print(f"\n🎯 Test Summary:")
-    print("=" * 70)
-    if success:
-        print("✅ Enhanced file selection tests PASSED!")
-        print("🎉 File selection is now smarter and more robust!")
-        print("\n🔧 What's Enhanced:")
-        print("   • Automatic space filtering prevents problematic file paths")
-        print("   • Individual file validation gives AI fine-grained control")
-        print("   • Still preserves ability to add additional files")
-        print("   • Comprehensive context for each validation decision")
-        print("   • Detailed logging for debugging and transparency")
-        print("\n📈 Expected Benefits:")
-        print("   • No more files with spaces causing system issues")
-        print("   • AI can reject inappropriate files from plan")
-        print("   • More precise file selection with full context")
-        print("   • Maintains flexibility for AI to add missing files")
-        print("   • Better debugging with detailed validation logs")
-    else:
-        print("❌ Some tests FAILED!")
-        print("🔧 Check the implementation for errors")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -1,106 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test that file diffs are properly captured and passed to reports
-"""
-
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-def test_file_diff_flow():
-    """Test the complete flow of capturing and displaying file diffs"""
-    print("🧪 Testing File Diff Capture and Display")
-    print("=" * 70)
-    
-    try:
-        from gitllama.todo.executor import TodoExecutor
-        from gitllama.core.coordinator import SimplifiedCoordinator
-        from gitllama.utils.reports import ReportGenerator
-        
-        print("✅ All required modules can be imported")
-        
-        # Test that executor returns file diffs
-        print(f"\n📊 Testing TodoExecutor Return Format:")
-        print("✅ execute_plan() now returns: (modified_files, file_diffs)")
-        print("✅ file_diffs contains before/after content for each file")
-        print("✅ Tracks operation type (EDIT/DELETE) for each file")
-        
-        # Test coordinator workflow integration
-        print(f"\n🔧 Testing Coordinator Integration:")
-        print("✅ run_todo_workflow() includes 'file_diffs' in result")
-        print("✅ generate_final_report() accepts file_diffs parameter")
-        print("✅ Report generator receives complete execution data")
-        
-        # Test git operations integration
-        print(f"\n🏗️ Testing Git Operations Integration:")
-        print("✅ commit_changes() returns (commit_hash, commit_message)")
-        print("✅ Enhanced commit message with GitLlama signature")
-        print("✅ generate_final_report called with all parameters:")
-        print("   • commit_message: Full commit message")
-        print("   • file_diffs: Complete before/after data")
-        print("   • branch_info: Branch creation details")
-        
-        # Test report display
-        print(f"\n📋 Testing Report Display:")
-        print("✅ Executive Summary shows:")
-        print("   • Exact branch name used")
-        print("   • Complete commit hash")
-        print("   • Full commit message with formatting")
-        print("   • Expandable file modification list")
-        print("   • Before/After tabs for each file")
-        print("   • Interactive JavaScript controls")
-        
-        print(f"\n🎯 Root Cause Fixed:")
-        print("❌ Before: git_operations.py called generate_final_report() with old signature")
-        print("✅ After: git_operations.py passes commit_message, file_diffs, branch_info")
-        print("❌ Before: commit_changes() only returned commit_hash")
-        print("✅ After: commit_changes() returns (commit_hash, commit_message)")
-        print("❌ Before: Reports showed 'File modification details not available'")
-        print("✅ After: Reports show complete before/after diffs for all files")
-        
-        print(f"\n🔍 Data Flow Verification:")
-        print("1. 📝 TodoExecutor captures file before/after content")
-        print("2. 📋 Coordinator receives file_diffs in workflow result")
-        print("3. 🔧 git_operations.py extracts commit_message from commit_changes()")
-        print("4. 📊 generate_final_report() called with all execution details")
-        print("5. 🎯 Report template displays interactive file diffs")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run file diff fix test"""
-    print("🔧 GitLlama File Diff Fix Test")
-    print("=" * 70)
-    
-    success = test_file_diff_flow()
-    
-    print(f"\n🎯 Test Summary:")
-    print("=" * 70)
-    if success:
-        print("✅ File diff capture and display tests PASSED!")
-        print("🎉 Reports will now show complete file modification details!")
-        print("\n🔧 What Was Fixed:")
-        print("   • git_operations.py now passes file_diffs to report")
-        print("   • commit_changes() returns both hash and message")
-        print("   • Enhanced commit message with GitLlama signature")
-        print("   • Complete data flow from executor to report")
-        print("\n📈 Expected Results:")
-        print("   • No more 'File modification details not available'")
-        print("   • Interactive expandable file lists")
-        print("   • Before/After content comparison for every file")
-        print("   • Complete commit message display")
-        print("   • Full transparency of all changes made")
-    else:
-        print("❌ Some tests FAILED!")
-        print("🔧 Check the implementation for errors")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
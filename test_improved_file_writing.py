@@ -1,105 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test the improved file writing with clearer prompts
-"""
-
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-def test_file_writing_improvements():
-    """Test the improved file writing prompt clarity"""
-    print("🧪 Testing Improved File Writing Prompts")
-    print("=" * 60)
-    
-    try:
-        from gitllama.todo.executor import TodoExecutor
-        from gitllama.ai import OllamaClient
-        
-        print("✅ TodoExecutor can be imported")
-        
-        # Test the improved prompt generation (without actually calling AI)
-        executor = TodoExecutor.__new__(TodoExecutor)  # Create without calling __init__
-        
-        # Test case 1: New file creation
-        file_path = "src/example.py"
-        plan = "Create a simple Python module with a main function"
-        todo = "Implement basic functionality"
-        original_content = ""  # New file
-        
-        print(f"\n📝 Testing NEW file creation for: {file_path}")
-        print("🔧 Old prompt would have unclear file requirements")
-        print("✅ New prompt clearly specifies:")
-        print(f"   • Exact file path: {file_path}")
-        print(f"   • File type: {Path(file_path).suffix}")
-        print("   • Structured context with plan and TODO")
-        print("   • Clear instructions about output format")
-        print("   • No markdown code blocks requirement")
-        
-        # Test case 2: File editing
-        file_path = "config/settings.json"
-        original_content = '{"debug": false}'
-        
-        print(f"\n✏️ Testing file REWRITE for: {file_path}")
-        print("🔧 Old prompt would have vague context")
-        print("✅ New prompt clearly specifies:")
-        print(f"   • Exact file path: {file_path}")
-        print(f"   • File type: {Path(file_path).suffix}")
-        print("   • Shows current content for reference")
-        print("   • Explains this is a COMPLETE rewrite")
-        print("   • Context-specific naming for tracking")
-        
-        print(f"\n🎯 Key Improvements Made:")
-        print("✅ File path prominently displayed in requirements")
-        print("✅ File type/extension clearly specified")
-        print("✅ Structured context with clear sections")
-        print("✅ Distinguishes between NEW vs REWRITE operations")
-        print("✅ Context-specific naming for better tracking")
-        print("✅ Clear instructions about output format")
-        print("✅ No more 'No additional context provided'")
-        
-        print(f"\n🏗️ Technical Changes:")
-        print("📂 Context includes: FILE PATH, FILE TYPE, PLAN, TODO")
-        print("📋 Requirements clearly state the exact task")
-        print("🏷️ Context names are file-specific (create_X, rewrite_X)")
-        print("🎯 Instructions emphasize exact file path repeatedly")
-        print("🚫 Removed confusing markdown code block requirements")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run file writing improvement test"""
-    print("🔧 GitLlama File Writing Improvements Test")
-    print("=" * 60)
-    
-    success = test_file_writing_improvements()
-    
-    print(f"\n🎯 Test Summary:")
-    print("=" * 60)
-    if success:
-        print("✅ File writing improvements tests PASSED!")
-        print("🎉 AI now gets crystal clear information about what file to create!")
-        print("\n🔧 What Changed:")
-        print("   • File path is prominently displayed in ALL prompts")
-        print("   • Context clearly structured with sections")
-        print("   • Distinguished NEW file vs REWRITE operations")
-        print("   • File-specific context names for tracking")
-        print("   • No more vague 'No additional context provided'")
-        print("\n📊 Expected Report Improvements:")
-        print("   • File Write exchanges show clear file paths")
-        print("   • Context section shows structured information")
-        print("   • Requirements clearly state the exact file being created")
-    else:
-        print("❌ Some tests FAILED!")
-        print("🔧 Check the implementation for errors")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -1,101 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test the query type identification in reports
-"""
-
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-def test_query_type_tracking():
-    """Test that query types are properly tracked and displayed in reports"""
-    print("🧪 Testing Query Type Identification in Reports")
-    print("=" * 60)
-    
-    try:
-        from gitllama.utils.context_tracker import context_tracker
-        from gitllama.utils.reports import ReportGenerator
-        
-        # Reset tracker for clean test
-        context_tracker.reset()
-        
-        # Start a test stage
-        context_tracker.start_stage("Test_Query_Types")
-        
-        # Simulate different query types being stored
-        test_queries = [
-            ("What should we do?", "Create a new feature", "multiple_choice"),
-            ("Language?", "Python", "single_word"), 
-            ("Explain the architecture", "This system uses...", "open"),
-            ("def main():\n    pass", "def main():\n    pass", "file_write")
-        ]
-        
-        for i, (prompt, response, query_type) in enumerate(test_queries, 1):
-            context_tracker.store_prompt_and_response(
-                prompt=f"Test prompt {i}: {prompt}",
-                response=response,
-                query_type=query_type
-            )
-        
-        # Get stats to verify tracking
-        stats = context_tracker.get_total_stats()
-        print(f"✅ Total exchanges tracked: {stats['total_pairs']}")
-        print(f"📊 Query type breakdown:")
-        
-        for query_type, count in stats.get('query_type_breakdown', {}).items():
-            emoji = {
-                'multiple_choice': '🔤',
-                'single_word': '📝', 
-                'open': '📰',
-                'file_write': '📄'
-            }.get(query_type, '❓')
-            print(f"   {emoji} {query_type}: {count}")
-        
-        print(f"\n🎯 Key Features Implemented:")
-        print("✅ Query types tracked in context_tracker")
-        print("✅ Exchange headers show query type badges")
-        print("✅ Color-coded query type indicators")
-        print("✅ Query type breakdown in summary stats")
-        print("✅ Distinct styling for each of 4 query types")
-        
-        print(f"\n🏗️ Report Features Added:")
-        print("📊 Executive Summary shows query type breakdown")
-        print("🔤 Multiple Choice queries - Yellow/Orange styling")
-        print("📝 Single Word queries - Blue styling") 
-        print("📰 Open Response queries - Green styling")
-        print("📄 File Write queries - Purple styling")
-        print("🏛️ Congressional votes still shown with tooltips")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run query type tracking test"""
-    print("🔍 GitLlama Query Type Identification Test")
-    print("=" * 60)
-    
-    success = test_query_type_tracking()
-    
-    print(f"\n🎯 Test Summary:")
-    print("=" * 60)
-    if success:
-        print("✅ Query type identification tests PASSED!")
-        print("🎉 Reports now show query types for each exchange!")
-        print("\n🔧 What's New:")
-        print("   • Exchange headers show query type badges")
-        print("   • Executive summary shows query type breakdown")
-        print("   • Color-coded styling for each query type")
-        print("   • Full visibility into AI interaction patterns")
-    else:
-        print("❌ Some tests FAILED!")
-        print("🔧 Check the implementation for errors")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
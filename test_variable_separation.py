@@ -1,130 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test the variable separation and per-exchange variable tracking
-"""
-
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-def test_variable_separation():
-    """Test that variables are properly separated and tracked per exchange"""
-    print("🧪 Testing Variable Separation and Per-Exchange Tracking")
-    print("=" * 70)
-    
-    try:
-        from gitllama.utils.context_tracker import context_tracker
-        from gitllama.todo.executor import TodoExecutor
-        
-        # Reset tracker for clean test
-        context_tracker.reset()
-        context_tracker.start_stage("Test_Variable_Separation")
-        
-        # Simulate the executor storing variables separately
-        file_path = "src/example.py"
-        file_name = Path(file_path).name
-        file_type = Path(file_path).suffix
-        context_name = f"create_{file_name}"
-        plan = "Create a Python module with main function"
-        todo = "Implement basic functionality"
-        
-        print(f"📝 Simulating file creation for: {file_path}")
-        
-        # Store variables separately (like the new executor does)
-        context_tracker.store_variable(f"{context_name}_file_path", file_path, f"Target file path: {file_path}")
-        context_tracker.store_variable(f"{context_name}_file_name", file_name, f"Target file name: {file_name}")  
-        context_tracker.store_variable(f"{context_name}_file_type", file_type, f"File extension: {file_type}")
-        context_tracker.store_variable(f"{context_name}_plan", plan, "Action plan excerpt")
-        context_tracker.store_variable(f"{context_name}_todo", todo, "TODO excerpt")
-        
-        # Simulate a file_write call with these variables
-        variables_used = {
-            f"{context_name}_file_path": file_path,
-            f"{context_name}_file_name": file_name,
-            f"{context_name}_file_type": file_type,
-            f"{context_name}_plan": plan,
-            f"{context_name}_todo": todo
-        }
-        
-        context_tracker.store_prompt_and_response(
-            prompt="Generate complete content for file based on requirements...",
-            response="# Example Python module\nif __name__ == '__main__':\n    print('Hello world')",
-            variable_map=variables_used,
-            query_type="file_write"
-        )
-        
-        # Check what we tracked
-        stats = context_tracker.get_total_stats()
-        stage_data = context_tracker.get_stage_summary("Test_Variable_Separation")
-        
-        print(f"✅ Variables tracked: {len(stage_data['variables'])}")
-        print(f"✅ Exchanges tracked: {len(stage_data['prompt_response_pairs'])}")
-        
-        # Show the variables that were separated out
-        print(f"\n📦 Variables Extracted from Context:")
-        for var_name, var_data in stage_data['variables'].items():
-            if not var_name.endswith('_congress'):
-                print(f"   🏷️ {var_name}: {var_data['description']}")
-        
-        # Show exchange-specific variables
-        if stage_data['prompt_response_pairs']:
-            exchange = stage_data['prompt_response_pairs'][0]
-            print(f"\n🎯 Variables Used in Exchange #1:")
-            for var_name in exchange.get('variables_used', {}):
-                if not var_name.endswith('_congress'):
-                    print(f"   📝 {var_name}")
-        
-        print(f"\n🎯 Key Improvements Implemented:")
-        print("✅ File path extracted as separate variable (not embedded in context)")
-        print("✅ File name extracted as separate variable")  
-        print("✅ File type extracted as separate variable")
-        print("✅ Plan content extracted as separate variable")
-        print("✅ TODO content extracted as separate variable")
-        print("✅ Variables shown per exchange instead of per stage")
-        print("✅ Clean context without embedded variable text")
-        
-        print(f"\n🏗️ Report Changes:")
-        print("❌ Removed: 'Variables Used in This Stage' section")
-        print("✅ Added: 'Variables Used in This Exchange' for each exchange")
-        print("🎯 More accurate: Variables tied to specific AI interactions")
-        print("🔍 Better tracking: Separate variables instead of embedded text")
-        print("📊 Cleaner context: No FILE PATH: embedded in context text")
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-def main():
-    """Run variable separation test"""
-    print("🔧 GitLlama Variable Separation Test")
-    print("=" * 70)
-    
-    success = test_variable_separation()
-    
-    print(f"\n🎯 Test Summary:")
-    print("=" * 70)
-    if success:
-        print("✅ Variable separation tests PASSED!")
-        print("🎉 Variables are now properly separated and tracked per exchange!")
-        print("\n🔧 What Changed:")
-        print("   • FILE PATH, FILE TYPE, etc. are now separate tracked variables")
-        print("   • Context is clean without embedded variable text")
-        print("   • Variables shown per exchange instead of per stage")
-        print("   • More accurate tracking of what variables each AI call used")
-        print("\n📊 Expected Report Improvements:")
-        print("   • Each exchange shows exactly which variables it used")
-        print("   • No more stage-level variable confusion")
-        print("   • Cleaner context sections without embedded metadata")
-        print("   • Better color-coded variable highlighting")
-    else:
-        print("❌ Some tests FAILED!")
-        print("🔧 Check the implementation for errors")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Shared pytest configuration for gitLlama tests."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
+
+
+@pytest.fixture(scope="session")
+def gitllama_mods():
+    """Import the gitllama modules under test once per session"""
+    return SimpleNamespace(
+        client=pytest.importorskip("gitllama.ai.client"),
+        query=pytest.importorskip("gitllama.ai.query"),
+        congress=pytest.importorskip("gitllama.ai.congress"),
+        representatives=pytest.importorskip("gitllama.ai.representatives"),
+        coordinator=pytest.importorskip("gitllama.core.coordinator"),
+        planner=pytest.importorskip("gitllama.todo.planner"),
+        executor=pytest.importorskip("gitllama.todo.executor"),
+        reports=pytest.importorskip("gitllama.utils.reports"),
+    )
@@ -0,0 +1,364 @@
+"""
+Smoke tests for congress models, executive summary, file selection and file writing
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytestmark = pytest.mark.smoke
+
+
+# Expected individual models for each representative
+EXPECTED_MODELS = {
+    "Caspar the Rational": "gemma3:4b",
+    "Melchior the Visionary": "gemma3:4b",
+    "Balthasar the Compassionate": "gemma3:4b"
+}
+
+
+class FakeAI:
+    """Stands in for AIQuery, returning canned responses and recording requests"""
+
+    def __init__(self, query, open_response="", file_write_response=""):
+        self.query = query
+        self.open_response = open_response
+        self.file_write_response = file_write_response
+        self.file_write_calls = []
+        self.multi_file_write_calls = []
+
+    def clean_file_content(self, response):
+        return self.query.AIQuery.clean_file_content(response)
+
+    def open(self, prompt, context="", context_name="open", auto_compress=True):
+        return self.query.OpenResult(content=self.open_response, raw=self.open_response)
+
+    def file_write(self, requirements, context="", context_name="file_write", auto_compress=True):
+        self.file_write_calls.append({
+            "requirements": requirements,
+            "context": context,
+            "context_name": context_name,
+        })
+        raw = self.file_write_response
+        if callable(raw):
+            raw = raw(requirements)
+        return self.query.FileWriteResult(content=self.clean_file_content(raw), raw=raw)
+
+    def multi_file_write(self, files, context="", context_name="multi_file_write", auto_compress=True):
+        self.multi_file_write_calls.append({
+            "files": files,
+            "context": context,
+            "context_name": context_name,
+        })
+        raw = self.file_write_response
+        contents = {path: self.clean_file_content(body)
+                    for path, body in self.query.FILE_BLOCK_RE.findall(raw) if path in files}
+        return self.query.MultiFileWriteResult(files=contents, raw=raw)
+
+
+@pytest.fixture
+def offline_client(gitllama_mods):
+    """A real OllamaClient on an unreachable URL; tests replace its AI layer or chat_stream"""
+    return gitllama_mods.client.OllamaClient("http://127.0.0.1:9")
+
+
+@pytest.mark.parametrize("fallback_model", ["mistral:7b", "phi3:3.8b", "gemma3:4b"])
+def test_congress_individual_models(gitllama_mods, offline_client, fallback_model):
+    """Test that each congress representative has their own individual model"""
+    congress_mod = gitllama_mods.congress
+    # The fallback model should not affect the representatives' individual models
+    congress = congress_mod.Congress(offline_client, fallback_model)
+
+    actual = {rep.name_title: rep.model for rep in congress_mod.REPRESENTATIVES}
+    assert actual == EXPECTED_MODELS, (fallback_model, actual)
+
+    congress_info = congress.get_congress_info()
+    assert congress_info['total_representatives'] == len(EXPECTED_MODELS)
+    assert sorted(congress_info['models']) == sorted(EXPECTED_MODELS.values())
+
+    info_models = {rep['name_title']: rep['model'] for rep in congress_info['representatives']}
+    assert info_models == EXPECTED_MODELS, info_models
+
+
+def test_enhanced_executive_summary(gitllama_mods):
+    """Test the enhanced executive summary features"""
+    ReportGenerator = gitllama_mods.reports.ReportGenerator
+
+    repo_url = "https://github.com/test/repo.git"
+    report_gen = ReportGenerator(repo_url)
+
+    # Simulate execution results with detailed information
+    sample_file_diffs = {
+        "src/main.py": {
+            "before": "def main():\n    print('Hello')",
+            "after": "def main():\n    print('Hello World!')\n    return 0",
+            "operation": "EDIT"
+        },
+        "config/settings.json": {
+            "before": "",
+            "after": '{\n  "debug": true,\n  "version": "1.0.0"\n}',
+            "operation": "EDIT"
+        },
+        "legacy/old_file.py": {
+            "before": "# Old deprecated code\npass",
+            "after": "",
+            "operation": "DELETE"
+        }
+    }
+
+    branch_info = {
+        "created": True,
+        "base_branch": "main",
+        "description": "Created new feature branch"
+    }
+
+    commit_message = """Implement user authentication system
+
+- Add login/logout functionality
+- Create user session management
+- Update database schema for users
+- Add password hashing utilities
+
+🤖 Generated with GitLlama v0.7.4"""
+
+    report_gen.set_executive_summary(
+        repo_path="/home/user/test-repo",
+        branch="feat/user-auth",
+        modified_files=["src/main.py", "config/settings.json", "legacy/old_file.py"],
+        commit_hash="abc123def456789",
+        success=True,
+        total_decisions=15,
+        commit_message=commit_message,
+        file_diffs=sample_file_diffs,
+        branch_info=branch_info
+    )
+
+    summary = report_gen.executive_summary
+    assert summary["repo_url"] == repo_url
+    assert summary["branch_selected"] == "feat/user-auth"
+    assert summary["commit_hash"] == "abc123def456789"
+    assert summary["commit_message"] == commit_message
+    assert summary["success"] is True
+    assert summary["total_ai_decisions"] == 15
+    assert summary["file_diffs"] == sample_file_diffs
+    assert summary["branch_info"] == branch_info
+    assert summary["execution_time"] >= 0
+
+
+def test_enhanced_file_selection(gitllama_mods, tmp_path, offline_client):
+    """Test that planned files are classified, and directory and spaced paths dropped"""
+    planner = gitllama_mods.planner.TodoPlanner(offline_client)
+    planner.set_project_root(tmp_path)
+    # Resolution and validation ask the AI; pass paths through unchanged
+    planner._resolve_file_path_with_ai = lambda path, *args: path
+    planner._validate_files_individually = lambda files, *args: files
+    planner._collect_additional_files = lambda plan, files, *args: files
+
+    planned_files = [
+        "src/main.py",
+        "CREATE: config/settings.json",
+        "DELETE: old file with spaces.py",
+        "docs/README.md",
+        "test files/unit_test.py",
+        "src/",
+        "DELETE: legacy/old.py",
+    ]
+
+    files = planner._collect_files_with_context("plan", planned_files)
+
+    assert [(f['path'], f['operation']) for f in files] == [
+        ("src/main.py", "EDIT"),
+        ("config/settings.json", "CREATE"),
+        ("docs/README.md", "EDIT"),
+        ("legacy/old.py", "DELETE"),
+    ]
+    assert files[1]['original'] == "CREATE: config/settings.json"
+
+
+def test_extract_file_list_from_plan(gitllama_mods, offline_client):
+    """Test that bullets, numbering and headings are stripped from the AI file list"""
+    planner = gitllama_mods.planner.TodoPlanner(offline_client)
+    planner.ai = FakeAI(gitllama_mods.query, open_response="\n".join([
+        "List of files:",
+        "# Source",
+        "- src/main.py",
+        "* CREATE: src/cli.py",
+        "2. DELETE: old.py",
+        "",
+        "README.md",
+    ]))
+
+    assert planner._extract_file_list_from_plan("plan") == [
+        "src/main.py",
+        "CREATE: src/cli.py",
+        "DELETE: old.py",
+        "README.md",
+    ]
+
+
+def test_file_diff_flow(gitllama_mods, tmp_path, offline_client):
+    """Test that execute_plan writes batched edits, deletes files and captures diffs"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("print('Hello')\n")
+    (tmp_path / "legacy.py").write_text("pass\n")
+
+    executor = gitllama_mods.executor.TodoExecutor(offline_client)
+    executor.ai = FakeAI(gitllama_mods.query, file_write_response=(
+        "<<<FILE:src/main.py>>>\n```python\nprint('Hello World!')\n```\n<<<END>>>\n"
+        "<<<FILE:config/settings.json>>>\n{\"debug\": true}\n<<<END>>>"
+    ))
+
+    action_plan = {
+        "plan": "Say hello to the world and add settings",
+        "todo_excerpt": "- [ ] greet everyone",
+        "files_to_modify": [
+            {"path": "src/main.py", "operation": "EDIT"},
+            {"path": "config/settings.json", "operation": "EDIT"},
+            {"path": "legacy.py", "operation": "DELETE"},
+            {"path": "missing.py", "operation": "DELETE"},
+        ],
+    }
+
+    modified_files, file_diffs = executor.execute_plan(tmp_path, action_plan)
+
+    # Both edits came back from a single batched request, each with its own rules
+    assert executor.ai.file_write_calls == []
+    (call,) = executor.ai.multi_file_write_calls
+    assert call["context_name"] == "batch_write_1_2_files"
+    assert "completely rewriting the Python application file: src/main.py" in call["files"]["src/main.py"]
+    assert "creating a new Python application file: config/settings.json" in call["files"]["config/settings.json"]
+    assert "print('Hello')" in call["context"]
+    assert modified_files == ["src/main.py", "config/settings.json", "legacy.py"]
+    assert (tmp_path / "src" / "main.py").read_text() == "print('Hello World!')"
+    assert (tmp_path / "config" / "settings.json").read_text() == '{"debug": true}'
+    assert not (tmp_path / "legacy.py").exists()
+    assert file_diffs == {
+        "src/main.py": {"before": "print('Hello')\n", "after": "print('Hello World!')", "operation": "EDIT"},
+        "config/settings.json": {"before": "", "after": '{"debug": true}', "operation": "EDIT"},
+        "legacy.py": {"before": "pass\n", "after": "", "operation": "DELETE"},
+    }
+
+
+def test_atomic_write_keeps_mode_and_symlinks(gitllama_mods, tmp_path):
+    """Test that rewrites keep the file mode and write through symlinks"""
+    atomic_write = gitllama_mods.executor._atomic_write
+    script = tmp_path / "run.sh"
+    atomic_write(script, "echo one\n")
+    script.chmod(0o755)
+    link = tmp_path / "link.sh"
+    link.symlink_to(script)
+
+    atomic_write(link, "echo two\n")
+
+    assert link.is_symlink()
+    assert script.read_text() == "echo two\n"
+    assert script.stat().st_mode & 0o777 == 0o755
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["link.sh", "run.sh"]
+
+
+def test_improved_planner(gitllama_mods, tmp_path, offline_client):
+    """Test project scanning and path heuristics of the planner"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("")
+    (tmp_path / "README.md").write_text("")
+    (tmp_path / "image.png").write_bytes(b"")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "secret.py").write_text("")
+
+    planner = gitllama_mods.planner.TodoPlanner(offline_client)
+    assert planner._get_all_file_paths() == []
+
+    planner.set_project_root(tmp_path)
+    assert planner._get_all_file_paths() == ["README.md", "src/app.py"]
+    tree = planner._generate_project_tree()
+    assert "app.py" in tree and "secret.py" not in tree
+
+    assert planner._is_likely_directory_path("src")
+    assert planner._is_likely_directory_path("lib/")
+    assert planner._is_likely_directory_path("app/tests")
+    assert not planner._is_likely_directory_path("src/main.py")
+
+    assert planner._parse_file_path("Use src/my module.py") == "src/my_module.py"
+    assert planner._parse_file_path("tests/test_api") == "tests/test_api.py"
+    assert planner._parse_file_path("docs/guide") == "docs/guide.md"
+    assert planner._parse_file_path("config/app") == "config/app.json"
+
+
+def test_file_writing_improvements(gitllama_mods, offline_client):
+    """Test that new and existing files get the create and rewrite prompts"""
+    executor = gitllama_mods.executor.TodoExecutor(offline_client)
+    executor.ai = FakeAI(gitllama_mods.query, file_write_response=lambda requirements: "```python\nVALUE = 1\n```")
+
+    content = executor._edit_file_content("src/example.py", "", "the plan", "the todo")
+    assert content == "VALUE = 1"
+    call = executor.ai.file_write_calls[-1]
+    assert call["context_name"] == "create_example.py"
+    assert "creating a new Python application file: src/example.py" in call["requirements"]
+    assert "CURRENT FILE CONTENT" not in call["context"]
+
+    executor._edit_file_content("config/settings.json", '{"debug": false}', "the plan", "the todo")
+    call = executor.ai.file_write_calls[-1]
+    assert call["context_name"] == "rewrite_settings.json"
+    assert "completely rewriting the Python application file: config/settings.json" in call["requirements"]
+    assert '{"debug": false}' in call["context"]
+
+    # An identical request is served from the executor's file_write cache
+    executor._edit_file_content("config/settings.json", '{"debug": false}', "the plan", "the todo")
+    assert len(executor.ai.file_write_calls) == 2
+
+
+def test_file_write_cache_is_bounded_under_concurrency(gitllama_mods, offline_client, monkeypatch):
+    """Test that edit workers can fill and evict the shared file_write cache together"""
+    monkeypatch.setattr(gitllama_mods.executor, "FILE_WRITE_CACHE_SIZE", 4)
+    executor = gitllama_mods.executor.TodoExecutor(offline_client)
+    executor.ai = FakeAI(gitllama_mods.query, file_write_response=lambda requirements: requirements)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(
+            lambda i: executor._file_write(f"file {i}", "context", f"ctx_{i}").content, range(200)
+        ))
+
+    assert results == [f"file {i}" for i in range(200)]
+    assert len(executor._file_write_cache) <= 4
+
+
+def test_multi_file_write_votes_on_each_file(gitllama_mods, offline_client):
+    """Test that a multi-file response is split into files and each file is voted on"""
+    voted_on = []
+
+    def chat_stream(model, messages, system=None, context_name="default"):
+        if context_name == "batch":
+            yield "<<<FILE:a.py>>>\nA = 1\n<<<END>>>\n<<<FILE:b.py>>>\n```python\nB = 2\n```\n<<<END>>>"
+        else:
+            voted_on.append(messages[-1]["content"])
+            yield "VOTE: YES\nCONFIDENCE: 0.9\nREASON: Looks sound"
+
+    offline_client.chat_stream = chat_stream
+    ai = gitllama_mods.query.AIQuery(offline_client)
+
+    result = ai.multi_file_write(
+        {"a.py": "Write module a", "b.py": "Write module b", "c.py": "Write module c"},
+        context_name="batch"
+    )
+
+    assert result.files == {"a.py": "A = 1", "b.py": "B = 2"}
+    assert set(result.congress_decisions) == {"a.py", "b.py"}
+    representatives = len(gitllama_mods.congress.REPRESENTATIVES)
+    assert len(voted_on) == 2 * representatives
+    assert all("Write module a" in prompt for prompt in voted_on[:representatives])
+
+
+def test_congress_concurrent_sessions_get_unique_numbers(gitllama_mods, offline_client):
+    """Test that sessions evaluated from worker threads never share a number"""
+    def slow_vote(model, messages, system=None, context_name="default"):
+        time.sleep(0.01)
+        yield "VOTE: YES\nCONFIDENCE: 0.9\nREASON: Looks sound"
+
+    offline_client.chat_stream = slow_vote
+    congress = gitllama_mods.congress.Congress(offline_client, "gemma3:4b")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda i: congress.evaluate_response(f"prompt {i}", "response"), range(8)))
+
+    session_numbers = sorted(s["session_number"] for s in congress.voting_sessions)
+    assert session_numbers == list(range(1, 9))
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Test the new Magi-inspired representatives system
+"""
+
+from gitllama.ai.representatives import REPRESENTATIVES, build_context_prompt
+
+def test_humanity_representatives():
+    """Test the new templated humanity representatives"""
+    assert [rep.name_title for rep in REPRESENTATIVES] == [
+        "Caspar the Rational",
+        "Melchior the Visionary",
+        "Balthasar the Compassionate"
+    ]
+    
+    for rep in REPRESENTATIVES:
+        assert rep.personality, rep.name_title
+        assert rep.voting_style, rep.name_title
+        assert rep.model, rep.name_title
+        assert rep.likes and rep.dislikes, rep.name_title
+    
+    # Test the template system
+    example_rep = REPRESENTATIVES[0]  # Caspar
+    template = build_context_prompt(example_rep)
+    
+    assert template.startswith(f"You are {example_rep.name_title}")
+    assert ", ".join(example_rep.likes) in template
+    assert ", ".join(example_rep.dislikes) in template
+    assert "VOTE: [YES/NO]" in template
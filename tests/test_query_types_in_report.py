@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test the query type identification in reports
+"""
+
+from gitllama.utils.context_tracker import context_tracker
+
+_QTYPE_EMOJI = {
+    'multiple_choice': '🔤',
+    'single_word': '📝',
+    'open': '📰',
+    'file_write': '📄'
+}
+
+def test_query_type_tracking():
+    """Test that query types are properly tracked and displayed in reports"""
+    # Reset tracker for clean test
+    context_tracker.reset()
+    
+    # Start a test stage
+    context_tracker.start_stage("Test_Query_Types")
+    
+    # Simulate different query types being stored
+    test_queries = [
+        ("What should we do?", "Create a new feature", "multiple_choice"),
+        ("Language?", "Python", "single_word"),
+        ("Explain the architecture", "This system uses...", "open"),
+        ("def main():\n    pass", "def main():\n    pass", "file_write")
+    ]
+    
+    store = context_tracker.store_prompt_and_response
+    for i, (prompt, response, query_type) in enumerate(test_queries, 1):
+        store(
+            prompt=f"Test prompt {i}: {prompt}",
+            response=response,
+            query_type=query_type
+        )
+    
+    # Get stats to verify tracking
+    stats = context_tracker.get_total_stats()
+    assert stats['total_pairs'] == 4
+    
+    breakdown = stats['query_type_breakdown']
+    assert set(breakdown) == set(_QTYPE_EMOJI)
+    assert all(count == 1 for count in breakdown.values()), breakdown
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the enhanced timing features in reports
+"""
+
+import re
+from typing import NamedTuple
+
+import pytest
+
+from gitllama.utils.context_tracker import context_tracker
+
+class TimingPair(NamedTuple):
+    """A simulated exchange with its execution time"""
+    prompt: str
+    response: str
+    query_type: str
+    execution_time: float
+
+_TEST_PAIRS = (
+    TimingPair("Test multiple choice query", "A", "multiple_choice", 1.25),
+    TimingPair("Test single word query", "Python", "single_word", 0.87),
+    TimingPair("Test open response query",
+               "This is a detailed response explaining the system architecture...", "open", 3.42),
+    TimingPair("Test file write query",
+               "def main():\n    print('Hello World!')\n    return 0", "file_write", 2.16),
+)
+
+@pytest.fixture
+def timing_stage():
+    """Give each case a freshly reset tracker with an active timing stage"""
+    context_tracker.reset()
+    context_tracker.start_stage("Test_Timing")
+    return "Test_Timing"
+
+@pytest.mark.parametrize("pair", _TEST_PAIRS, ids=[pair.query_type for pair in _TEST_PAIRS])
+def test_timing_enhancements(timing_stage, pair):
+    """Test the enhanced timing features"""
+    # Simulate storing a prompt-response pair with timing
+    variables_used = {
+        "context": "Test context",
+        "question": "Test question"
+    }
+    
+    context_tracker.store_prompt_and_response(
+        prompt=pair.prompt,
+        response=pair.response,
+        variable_map=variables_used,
+        query_type=pair.query_type,
+        execution_time_seconds=pair.execution_time
+    )
+    
+    # Check what was stored
+    stage_data = context_tracker.get_stage_summary(timing_stage)
+    stored_pairs = stage_data['prompt_response_pairs']
+    assert len(stored_pairs) == 1
+    
+    stored = stored_pairs[0]
+    assert stored['query_type'] == pair.query_type
+    assert stored['execution_time_seconds'] == pair.execution_time
+    assert re.fullmatch(r"\d{2}:\d{2}:\d{2}", stored['clock_time']), stored['clock_time']
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test the variable separation and per-exchange variable tracking
+"""
+
+import json
+from pathlib import PurePosixPath
+
+from gitllama.utils.context_tracker import context_tracker
+
+def test_variable_separation():
+    """Test that variables are properly separated and tracked per exchange"""
+    # Reset tracker for clean test
+    context_tracker.reset()
+    context_tracker.start_stage("Test_Variable_Separation")
+    
+    # Simulate the executor storing variables separately
+    file_path = "src/example.py"
+    p = PurePosixPath(file_path)
+    file_name = p.name
+    file_type = p.suffix
+    context_name = f"create_{file_name}"
+    prefix = f"{context_name}_"
+    plan = "Create a Python module with main function"
+    todo = "Implement basic functionality"
+    
+    # Store variables separately (like the new executor does)
+    context_tracker.store_variables({
+        prefix + "file_path": (file_path, f"Target file path: {file_path}"),
+        prefix + "file_name": (file_name, f"Target file name: {file_name}"),
+        prefix + "file_type": (file_type, f"File extension: {file_type}"),
+        prefix + "plan": (plan, "Action plan excerpt"),
+        prefix + "todo": (todo, "TODO excerpt"),
+    })
+    
+    # Simulate a file_write call with these variables
+    variables_used = {
+        prefix + "file_path": file_path,
+        prefix + "file_name": file_name,
+        prefix + "file_type": file_type,
+        prefix + "plan": plan,
+        prefix + "todo": todo
+    }
+    
+    context_tracker.store_prompt_and_response(
+        prompt="Generate complete content for file based on requirements...",
+        response="# Example Python module\nif __name__ == '__main__':\n    print('Hello world')",
+        variable_map=variables_used,
+        query_type="file_write"
+    )
+    
+    # Check what we tracked
+    stage_data = context_tracker.get_stage_summary("Test_Variable_Separation")
+    
+    variables = stage_data['variables']
+    assert set(variables) == set(variables_used)
+    assert variables[prefix + "file_path"]['description'] == "Target file path: src/example.py"
+    assert variables[prefix + "file_type"]['content'] == ".py"
+    
+    # Variables are tracked per exchange
+    exchanges = stage_data['prompt_response_pairs']
+    assert len(exchanges) == 1
+    assert set(exchanges[0]['variables_used']) == set(variables_used)
+
+def test_structured_variables_in_export():
+    """Test that list and dict variables serialize when the report is exported"""
+    context_tracker.reset()
+    context_tracker.start_stage("Test_Structured_Variables")
+    
+    context_tracker.store_variable("file_list", ["src/a.py", "src/b.py"], "Files to edit")
+    context_tracker.store_variable("settings", {"debug": True, 1: "one"}, "Settings")
+    context_tracker.store_prompt_and_response(
+        prompt="Which files?",
+        response="src/a.py",
+        query_type="open"
+    )
+    
+    export = context_tracker.export_for_report()
+    
+    variables = export['stages'][0]['variables']
+    assert json.loads(variables['file_list']['content']) == ["src/a.py", "src/b.py"]
+    assert json.loads(variables['settings']['content']) == {"debug": True, "1": "one"}
+    assert export['stats']['total_pairs'] == 1